@@ -0,0 +1,166 @@
+"""Runs the benchmark scenes and writes their measurements as json, so runs can be compared before upgrading.
+
+    python -m benchmarks.run --out results.json
+    python -m benchmarks.run --scenes text_wall plot --sizes 10 100 --compare results.json
+"""
+
+import argparse
+import gc
+import json
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import List
+
+from benchmarks.scenes import BenchmarkCase, DEFAULT_SIZES, get_cases
+from smanim import CONFIG, Canvas, reset_bidirectional
+
+# times are in seconds and sizes in bytes, smaller is better for all of them
+METRICS = [
+    "construct_s",
+    "snapshot_s",
+    "draw_s",
+    "svg_bytes",
+    "draw_json_bytes",
+    "construct_peak_bytes",
+    "snapshot_peak_bytes",
+]
+
+
+def measure_times(case: BenchmarkCase, canvas: Canvas) -> dict:
+    """Times construction, `snapshot()` and `draw()` of one build of the scene"""
+    canvas.reset_canvas(CONFIG)
+    reset_bidirectional()
+    start = time.perf_counter()
+    case.build(canvas)
+    construct_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    canvas.snapshot(preview=False, overwrite=True)
+    snapshot_s = time.perf_counter() - start
+    svg_bytes = canvas._get_svg_path(suffix=0).stat().st_size
+
+    # `draw` snapshots again and also serializes the metadata, then resets the canvas
+    start = time.perf_counter()
+    draw_json = canvas.draw()
+    draw_s = time.perf_counter() - start
+    return {
+        "construct_s": construct_s,
+        "snapshot_s": snapshot_s,
+        "draw_s": draw_s,
+        "svg_bytes": svg_bytes,
+        "draw_json_bytes": len(draw_json.encode("utf-8")),
+    }
+
+
+def measure_memory(case: BenchmarkCase, canvas: Canvas) -> dict:
+    """Measures the peak memory allocated by construction and by `snapshot()`, separately from timing since tracemalloc slows everything down"""
+    canvas.reset_canvas(CONFIG)
+    reset_bidirectional()
+    gc.collect()
+    tracemalloc.start()
+    try:
+        case.build(canvas)
+        _, construct_peak = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        base, _ = tracemalloc.get_traced_memory()
+        canvas.snapshot(preview=False, overwrite=True)
+        _, snapshot_peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    canvas.reset_canvas(CONFIG)
+    return {
+        "construct_peak_bytes": construct_peak,
+        "snapshot_peak_bytes": snapshot_peak - base,
+    }
+
+
+def run_case(case: BenchmarkCase, canvas: Canvas, repeat: int) -> dict:
+    result = {"name": case.name, "scene": case.scene, "n": case.n, **case.params}
+    try:
+        # the first run loads lazy imports and fills caches, so it is not counted
+        measure_times(case, canvas)
+        # the fastest of `repeat` runs, the others are slowed by noise
+        runs = [measure_times(case, canvas) for _ in range(repeat)]
+        for metric in runs[0]:
+            result[metric] = min(run[metric] for run in runs)
+        result.update(measure_memory(case, canvas))
+    except Exception as e:
+        # some layouts need optional dependencies, like scipy for kamada_kawai
+        result["error"] = f"{type(e).__name__}: {e}"
+        canvas.reset_canvas(CONFIG)
+    return result
+
+
+def format_value(metric: str, value: float) -> str:
+    if metric.endswith("_s"):
+        return f"{value * 1000:.1f}ms"
+    return f"{value / 1024:.1f}KB"
+
+
+def print_results(results: List[dict], baseline: dict[str, dict] | None = None):
+    for result in results:
+        if "error" in result:
+            print(f"{result['name']}: {result['error']}")
+            continue
+        parts = []
+        for metric in METRICS:
+            part = f"{metric}={format_value(metric, result[metric])}"
+            base = (baseline or {}).get(result["name"], {}).get(metric)
+            if base:
+                part += f" ({result[metric] / base:.2f}x)"
+            parts.append(part)
+        print(f"{result['name']}: {' '.join(parts)}")
+
+
+def main(argv: List[str] | None = None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--scenes", nargs="+", choices=list(DEFAULT_SIZES), help="default: all"
+    )
+    parser.add_argument(
+        "--sizes", nargs="+", type=int, help="overrides the default sizes of each scene"
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--out", type=Path, help="json file to write the results to")
+    parser.add_argument(
+        "--compare", type=Path, help="json results of an earlier run, to print ratios"
+    )
+    args = parser.parse_args(argv)
+
+    sizes = None
+    if args.sizes is not None:
+        sizes = {scene: args.sizes for scene in DEFAULT_SIZES}
+    cases = get_cases(args.scenes, sizes)
+    baseline = None
+    if args.compare is not None:
+        with open(args.compare) as f:
+            baseline = {result["name"]: result for result in json.load(f)["results"]}
+
+    canvas = Canvas(CONFIG)
+    results = []
+    with tempfile.TemporaryDirectory() as save_dir:
+        CONFIG.save_file_dir = Path(save_dir)
+        CONFIG.mk_dir_attempted = False
+        for case in cases:
+            result = run_case(case, canvas, args.repeat)
+            results.append(result)
+            print_results([result], baseline)
+
+    if args.out is not None:
+        report = {
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "repeat": args.repeat,
+            "results": results,
+        }
+        with open(args.out, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+"""Parameterized scenes that stress the hot paths of smanim, each built onto a canvas at a given size `n`."""
+
+from functools import partial
+import linecache
+import sys
+from typing import Callable, List, NamedTuple
+
+import numpy as np
+
+from smanim import (
+    Axes,
+    Canvas,
+    Graph,
+    Group,
+    NumberPlane,
+    Square,
+    Text,
+    run_with_assignment_capture,
+    trace_assignments,
+)
+
+__all__ = ["BenchmarkCase", "get_cases", "GRAPH_LAYOUTS", "DEFAULT_SIZES"]
+
+GRAPH_LAYOUTS = [
+    "circular",
+    "kamada_kawai",
+    "planar",
+    "random",
+    "shell",
+    "spectral",
+    "partite",
+    "tree",
+    "spiral",
+    "spring",
+]
+
+# scene => sizes run by default, chosen so the largest take around a second
+DEFAULT_SIZES = {
+    "graph": [10, 50, 200],
+    "number_plane": [2, 8, 16],
+    "text_wall": [10, 100, 1000],
+    "nested_groups": [10, 50, 200],
+    "plot": [100, 1000, 10000],
+    "traced_script": [10, 100, 500],
+}
+
+
+class BenchmarkCase(NamedTuple):
+    scene: str
+    n: int
+    params: dict
+    build: Callable[[Canvas], None]
+
+    @property
+    def name(self) -> str:
+        params = "".join(f",{key}={value}" for key, value in self.params.items())
+        return f"{self.scene}[n={self.n}{params}]"
+
+
+def graph(canvas: Canvas, n: int, layout: str) -> None:
+    # a binary tree, so every layout applies: it is planar, has a root and splits into levels
+    vertices = list(range(n))
+    edges = [((i - 1) // 2, i) for i in range(1, n)]
+    levels = {}
+    for v in vertices:
+        levels.setdefault(int(np.log2(v + 1)), []).append(v)
+    g = Graph(
+        vertices,
+        edges,
+        layout=layout,
+        root_vertex=0,
+        partitions=list(levels.values()),
+    )
+    canvas.add(g)
+
+
+def number_plane(canvas: Canvas, n: int) -> None:
+    # `n` grid lines per unit
+    canvas.add(NumberPlane(coord_step_size=1 / n))
+
+
+def text_wall(canvas: Canvas, n: int) -> None:
+    # repeated labels, like tick numbers and vertex names
+    labels = [Text(f"label {i % 50}", font_size=12) for i in range(n)]
+    num_cols = int(np.ceil(np.sqrt(n)))
+    canvas.add(Group(*labels).arrange_in_grid(num_cols=num_cols, buff=0.05))
+
+
+def nested_groups(canvas: Canvas, n: int) -> None:
+    # `n` levels, each a square wrapping the group below it
+    group = Group(Square(side_length=0.1))
+    for i in range(1, n):
+        group = Group(Square(side_length=0.1 + i * 0.02), group)
+    canvas.add(group)
+
+
+def plot(canvas: Canvas, n: int) -> None:
+    # one curve sampled at `n` points
+    axes = Axes()
+    x_min, x_max = axes.x_axis.x_min, axes.x_axis.x_max
+    axes.plot(np.sin, x_range=(x_min, x_max, (x_max - x_min) / n))
+    canvas.add(axes)
+
+
+TRACED_SCRIPT_FILENAME = "<benchmark-traced-script>"
+
+
+def get_traced_script(n: int) -> str:
+    """Returns a user script with `n` assigned squares, grouped and drawn like a diagram in the editor"""
+    lines = ["squares = []"]
+    for i in range(n):
+        lines.append(f"s{i} = Square(side_length=0.2).shift(RIGHT * {i % 20} * 0.3)")
+        lines.append(f"squares.append(s{i})")
+    lines.append("g = Group(*squares)")
+    lines.append("canvas.add(g)")
+    return "\n".join(lines) + "\n"
+
+
+def traced_script(canvas: Canvas, n: int, mode: str) -> None:
+    source = get_traced_script(n)
+    script_globals = {"__name__": "__main__"}
+    exec("from smanim import *", script_globals)
+    # draw onto the benchmark's canvas instead of the global one
+    script_globals["canvas"] = canvas
+    if mode == "instrument":
+        run_with_assignment_capture(source, TRACED_SCRIPT_FILENAME, script_globals)
+        return
+    # the tracer reads the source of traced frames through linecache
+    linecache.cache[TRACED_SCRIPT_FILENAME] = (
+        len(source),
+        None,
+        source.splitlines(keepends=True),
+        TRACED_SCRIPT_FILENAME,
+    )
+    code = compile(source, TRACED_SCRIPT_FILENAME, "exec")
+    sys.settrace(trace_assignments)
+    try:
+        exec(code, script_globals)
+    finally:
+        sys.settrace(None)
+
+
+def get_cases(
+    scenes: List[str] | None = None, sizes: dict[str, List[int]] | None = None
+) -> List[BenchmarkCase]:
+    """Returns every benchmark case of `scenes` (all by default), at `sizes` (`DEFAULT_SIZES` by default)"""
+    sizes = {**DEFAULT_SIZES, **(sizes or {})}
+    variants = {
+        "graph": [{"layout": layout} for layout in GRAPH_LAYOUTS],
+        "number_plane": [{}],
+        "text_wall": [{}],
+        "nested_groups": [{}],
+        "plot": [{}],
+        "traced_script": [{"mode": "settrace"}, {"mode": "instrument"}],
+    }
+    builders = {
+        "graph": graph,
+        "number_plane": number_plane,
+        "text_wall": text_wall,
+        "nested_groups": nested_groups,
+        "plot": plot,
+        "traced_script": traced_script,
+    }
+    cases = []
+    for scene in scenes if scenes is not None else list(builders):
+        if scene not in builders:
+            raise ValueError(f"Unknown benchmark scene: {scene}")
+        for n in sizes[scene]:
+            for params in variants[scene]:
+                build = partial(builders[scene], n=n, **params)
+                cases.append(BenchmarkCase(scene, n, params, build))
+    return cases
+
@@ -4,9 +4,10 @@ import traceback
 from smanim import *
 from smanim.mobject.transformable import TransformableMobject
 
-
-sys._getframe().f_trace = global_trace_assignments
-sys.settrace(trace_assignments)
+# run with --instrument to capture assignments by rewriting this file instead of tracing it
+if __name__ == "__main__" and "--instrument" not in sys.argv:
+    sys._getframe().f_trace = global_trace_assignments
+    sys.settrace(trace_assignments)
 canvas = Canvas(CONFIG)
 
 manual_suffix = "0"
@@ -231,6 +232,11 @@ def main():
         required=True,
         help="Choose which test function to run",
     )
+    parser.add_argument(
+        "--instrument",
+        action="store_true",
+        help="Capture assignments with run_with_assignment_capture instead of sys.settrace",
+    )
     args = parser.parse_args()
 
     test_functions = {
@@ -275,4 +281,12 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    if "--instrument" in sys.argv:
+        with open(__file__) as f:
+            source = f.read()
+        instrumented = run_with_assignment_capture(
+            source, __file__, {"__name__": "tracing_demo"}
+        )
+        instrumented["main"]()
+    else:
+        main()
@@ -1,6 +1,8 @@
 import ast
-from types import FrameType
-from typing import NamedTuple
+import hashlib
+from collections import OrderedDict
+from types import CodeType, FrameType
+from typing import Any, Callable, List, NamedTuple, Tuple
 from smanim.canvas import BROWSER_ENV
 from smanim.mobject.mobject import AccessPath, AccessType, Mobject
 
@@ -16,7 +18,13 @@ if BROWSER_ENV:
 else:
     import linecache
 
-__all__ = ["trace_assignments", "global_trace_assignments", "reset_bidirectional"]
+__all__ = [
+    "trace_assignments",
+    "global_trace_assignments",
+    "reset_bidirectional",
+    "instrument_assignments",
+    "run_with_assignment_capture",
+]
 
 
 class FunctionTodo(NamedTuple):
@@ -38,11 +46,24 @@ class FunctionTodo(NamedTuple):
 # line events
 function_todos: dict[str, FunctionTodo] = {}
 
+# lineno => (name of the assigned var or None, end lineno of the assignment)
+AssignmentIndex = dict[int, Tuple[str | None, int]]
+
+# filename => (the lines the index was built from, index), checked by identity on every line event
+assignment_indexes: dict[str, Tuple[List[str], AssignmentIndex]] = {}
+# (filename, content hash) => index, so unchanged files are not parsed again after a reset
+# least recently used first, bounded since every edit of a file adds an entry
+assignment_indexes_by_hash: OrderedDict[Tuple[str, str], AssignmentIndex] = OrderedDict()
+# (filename, content hash) => code compiled by `instrument_assignments`, bounded the same way
+instrumented_code_by_hash: OrderedDict[Tuple[str, str], CodeType] = OrderedDict()
+MAX_CACHED_BY_HASH = 32
+
 
 # called to reset global state without re-importing all modules on pyodide side
 def reset_bidirectional():
-    global function_todos
+    global function_todos, assignment_indexes
     function_todos = {}
+    assignment_indexes = {}
 
 
 def update_mobject_metadata(
@@ -69,7 +90,7 @@ def trace_assignments(frame: FrameType, event, arg):
     if frame.f_globals.get("__name__", "_NotNamed") == "__main__":
         lineno = frame.f_lineno
         if event == "line":
-            expr_str, end_lineno = get_ast_node_span(current_file, lineno)
+            assignment = get_assignment_index(current_file).get(lineno)
 
             # Capture previous line_to_process after it has been executed
             if frame_id in function_todos:
@@ -88,21 +109,14 @@ def trace_assignments(frame: FrameType, event, arg):
 
                     del function_todos[frame_id]
 
-            if expr_str and not expr_str.startswith("#"):
-                try:
-                    tree = ast.parse(expr_str, mode="exec")
-                    for node in ast.walk(tree):
-                        if isinstance(node, ast.Assign) and len(node.targets) == 1:
-                            target = node.targets[0]
-                            if isinstance(target, ast.Name):
-                                # Schedule this line to capture value after its execution
-                                function_todos[frame_id] = FunctionTodo(
-                                    line_to_process=lineno,
-                                    var_to_capture=target.id,
-                                    end_line_to_process=end_lineno,
-                                )
-                except SyntaxError:
-                    pass
+            if assignment is not None and assignment[0] is not None:
+                var_to_capture, end_lineno = assignment
+                # Schedule this line to capture value after its execution
+                function_todos[frame_id] = FunctionTodo(
+                    line_to_process=lineno,
+                    var_to_capture=var_to_capture,
+                    end_line_to_process=end_lineno,
+                )
 
         if event == "return":
             if frame_id in function_todos:
@@ -130,19 +144,134 @@ def global_trace_assignments(frame, event, arg):
 # see how to use these functions in tracing_demo.py
 
 
-def get_ast_node_span(file, target_lineno):
-    content = "".join(linecache.getlines(file))
-    root = ast.parse(content, filename=file)
+def get_assignment_index(file: str) -> AssignmentIndex:
+    """Returns the assignments in `file` by start lineno, parsing the file only when its contents change"""
+    lines = linecache.getlines(file)
+    cached = assignment_indexes.get(file)
+    if cached is not None and cached[0] is lines:
+        return cached[1]
+
+    content = "".join(lines)
+    index = get_cached_by_hash(
+        assignment_indexes_by_hash,
+        file,
+        content,
+        lambda: build_assignment_index(content, file),
+    )
+    assignment_indexes[file] = (lines, index)
+    return index
+
 
+def get_cached_by_hash(
+    cache: OrderedDict, file: str, content: str, build: Callable[[], Any]
+):
+    """Returns the value cached for this version of `file`, building it on a miss and evicting the least recently used"""
+    key = (file, hashlib.md5(content.encode("utf-8")).hexdigest())
+    value = cache.get(key)
+    if value is None:
+        value = build()
+        cache[key] = value
+        if len(cache) > MAX_CACHED_BY_HASH:
+            cache.popitem(last=False)
+    else:
+        cache.move_to_end(key)
+    return value
+
+
+def build_assignment_index(content: str, file: str = "<unknown>") -> AssignmentIndex:
+    try:
+        root = ast.parse(content, filename=file)
+    except SyntaxError:
+        return {}
+
+    index: AssignmentIndex = {}
     for node in ast.walk(root):
-        if isinstance(node, ast.Assign):
-            start_lineno = node.lineno
-            end_lineno = getattr(node, "end_lineno", start_lineno)
+        if isinstance(node, ast.Assign) and node.lineno not in index:
+            end_lineno = getattr(node, "end_lineno", node.lineno)
+            var_name = None
+            # only single assignments to a plain name are captured
+            if len(node.targets) == 1 and isinstance(node.targets[0], ast.Name):
+                var_name = node.targets[0].id
+            index[node.lineno] = (var_name, end_lineno)
+    return index
+
+
+# Alternative to settrace: rewrite the user's code so each `name = ...` is followed by an explicit capture call
+# Only the assignments themselves pay for the capture, instead of every line and return event in __main__
+# Usage: run_with_assignment_capture(code, filename) in place of sys.settrace(trace_assignments) and exec(code)
+
+CAPTURE_FUNCTION_NAME = "__smanim_capture_assignment__"
+
+
+def capture_assignment(value, var_to_capture: str, line_to_process: int) -> None:
+    if isinstance(value, Mobject):
+        update_mobject_metadata(
+            mobject=value,
+            var_to_capture=var_to_capture,
+            line_to_process=line_to_process,
+        )
+
+
+# fields of statements that hold more statements, e.g. the bodies of functions, loops and try blocks
+# expressions are never visited, since they cannot contain assignments
+STATEMENT_LIST_FIELDS = ("body", "orelse", "finalbody", "handlers", "cases")
+
+
+def instrument_statements(statements: List[ast.AST]) -> List[ast.AST]:
+    """Returns `statements` with a capture call after each assignment to a single name, recursing into nested blocks"""
+    instrumented = []
+    for node in statements:
+        for field in STATEMENT_LIST_FIELDS:
+            children = getattr(node, field, None)
+            if isinstance(children, list):
+                setattr(node, field, instrument_statements(children))
+        instrumented.append(node)
+        # only single assignments to a plain name are captured, same as trace_assignments
+        if (
+            isinstance(node, ast.Assign)
+            and len(node.targets) == 1
+            and isinstance(node.targets[0], ast.Name)
+        ):
+            instrumented.append(get_capture_statement(node, node.targets[0].id))
+    return instrumented
+
+
+def get_capture_statement(node: ast.Assign, var_name: str) -> ast.Expr:
+    # locations are copied onto each new node, since `ast.fix_missing_locations` walks the whole tree
+    def located(new_node: ast.AST) -> ast.AST:
+        return ast.copy_location(new_node, node)
+
+    call = ast.Call(
+        func=located(ast.Name(id=CAPTURE_FUNCTION_NAME, ctx=ast.Load())),
+        args=[
+            located(ast.Name(id=var_name, ctx=ast.Load())),
+            located(ast.Constant(value=var_name)),
+            located(ast.Constant(value=node.lineno)),
+        ],
+        keywords=[],
+    )
+    return located(ast.Expr(value=located(call)))
+
+
+def instrument_assignments(source: str, filename: str = "<string>") -> CodeType:
+    """Compiles `source` with a capture call inserted after every assignment to a single name.
+    The code is cached by content, so running an unchanged script again skips parsing and compiling.
+    """
+
+    def build() -> CodeType:
+        tree = ast.parse(source, filename=filename)
+        tree.body = instrument_statements(tree.body)
+        return compile(tree, filename, "exec")
+
+    return get_cached_by_hash(instrumented_code_by_hash, filename, source, build)
 
-            if start_lineno == target_lineno:
-                statement_lines = []
-                for lineno in range(start_lineno, end_lineno + 1):
-                    statement_lines.append(linecache.getline(file, lineno).strip())
-                return " ".join(statement_lines), end_lineno
 
-    return None, None
+def run_with_assignment_capture(
+    source: str, filename: str = "<string>", globals: dict | None = None
+) -> dict:
+    """Runs `source` like exec, attaching TOP_LEVEL_ASSIGN access paths to assigned mobjects. Returns the globals used."""
+    if globals is None:
+        globals = {"__name__": "__main__"}
+    globals[CAPTURE_FUNCTION_NAME] = capture_assignment
+    exec(instrument_assignments(source, filename), globals)
+    return globals
@@ -1,17 +1,20 @@
 class CustomLineCache:
     _cache = {}
+    # split once when cached, since lines are read on every traced line event
+    _lines = {}
 
     @classmethod
     def getline(cls, filename, lineno, module_globals=None):
-        lines = cls._cache.get(filename, "").splitlines()
+        lines = cls._lines.get(filename, [])
         if 1 <= lineno <= len(lines):
-            return lines[lineno - 1]
+            return lines[lineno - 1][:-1]
         return ""
 
     @classmethod
     def getlines(cls, filename):
-        return [line + "\n" for line in cls._cache.get(filename, "").splitlines()]
+        return cls._lines.get(filename, [])
 
     @classmethod
     def cache(cls, filename, contents):
         cls._cache[filename] = contents
+        cls._lines[filename] = [line + "\n" for line in contents.splitlines()]
@@ -1,12 +1,13 @@
 from __future__ import annotations
-import base64
 from collections import namedtuple
+import hashlib
 import html
-import inspect
 import json
+from contextlib import contextmanager
 from pathlib import Path
-from textwrap import dedent
-from typing import List, Tuple
+from time import perf_counter
+import tracemalloc
+from typing import Callable, List, TextIO, Tuple
 
 import numpy as np
 
@@ -29,15 +30,23 @@ from smanim.mobject.vmobject import VGroup, VMobject
 from smanim.mobject.text.text_mobject import Text
 from smanim.typing import InternalPoint3D_Array, Point3D, Vector3
 from smanim.utils.color import ManimColor
+from smanim.utils.frame_ops import get_caller_lineno
+from smanim.utils.glyph_metrics import get_glyph_metrics
+from smanim.utils.import_ops import lazy_import
 from smanim.utils.logger import log
 
 import itertools as it
-import svg
 
 from smanim.utils.space_ops import to_pixel_coords, to_pixel_len
+from smanim.utils.stats_ops import get_stats
+from smanim.utils.svg_ops import to_svg_path_data
+from smanim.utils.text_ops import get_base64_font
+from smanim.utils.timing_ops import PhaseTimer
 
 import sys
 
+svg = lazy_import("svg")
+
 # only use subprocess locally, not in browser with pyodide
 BROWSER_ENV = True
 if "pyodide" not in sys.modules:
@@ -58,14 +67,37 @@ MobjectMetadata = namedtuple(
 # for now, instance must be named lowercase 'canvas' to work with access paths for bidirectional features
 class Canvas:
     def __init__(self, config: Config):
+        # called with the seconds spent in each phase after every snapshot, kept across resets
+        self.timing_callback: Callable[[dict[str, float]], None] | None = None
         self.reset_canvas(config)
 
     def reset_canvas(self, config: Config):
         self.config = config
+        # phase => seconds spent in it by the last snapshot, when timings are tracked
+        self.last_timings: dict[str, float] = {}
+        self.timer = PhaseTimer()
+        # the time since the canvas was reset (or last drawn) is counted as user code
+        self.user_code_start = perf_counter()
+        # phase => bytes allocated and peak bytes, see `track_memory`
+        self.memory_deltas: dict[str, dict[str, int]] = {}
 
         self.mobjects = Group()
         self.num_snapshots = 0
         self.loaded_fonts = set()
+        # font path => chars used by the text in the current snapshot, for font subsetting
+        self.font_chars: dict[str, set[str]] = {}
+        # css declarations => class name, shared by all svg elements with the same style
+        self.style_classes: dict[Tuple[Tuple[str, str], ...], str] = {}
+        self.font_faces: List[str] = []
+        # mobject id => slice of the pixel coords buffer, filled by the batch transform in `snapshot`
+        self.pixel_coords_index: dict[int, slice] = {}
+        self.pixel_coords_buffer: InternalPoint3D_Array | None = None
+        # mobject id => (id of the shared <defs> path, x, y) for vmobjects drawn as a <use>
+        self.path_instances: dict[int, Tuple[str, float, float]] = {}
+        # id => outline of each glyph drawn by text with `as_paths`, written once in <defs>
+        self.glyph_defs: dict[str, svg.Path] = {}
+        # mobject id => resolved (path, lineno), shared across the metadata pass in `snapshot`
+        self.access_path_memo: dict[int, Tuple[str | None, int | None]] = {}
 
     def add(self, *mobjects: Mobject):
         for mobject in mobjects:
@@ -75,29 +107,25 @@ class Canvas:
                 log.warning(f"Mobject already added: {mobject}")
             else:
                 # assume this fn is called from the main file
-                caller_frame = inspect.stack()[1]
-                lineno = caller_frame.lineno
-                old_len = len(self.mobjects)
-                # TODO: Remove would break the index set within subpath here.
-                # A major fix would be to make canvas a `mobject`. This has other benefits too.
-                # Then I could use mob_id and parent for index lookup (base mobject functionality)
-                # For now, I'm removing remove so that this doesn't break things
+                lineno = get_caller_lineno() if self.config.track_lineno else None
+                # the index into `canvas.mobjects` is resolved when the path is read, so it survives removals
                 new_access_path = AccessPath(
                     type=AccessType.ADD_TO_CANVAS,
-                    subpath=f"canvas.mobjects[{old_len}]",
-                    parent=None,
+                    subpath="canvas.mobjects",
+                    parent=self.mobjects,
                     lineno=lineno,
+                    mob_id=id(mobject),
                 )
                 mobject.access_paths.append(new_access_path)
 
                 self.mobjects.add(mobject)
 
-    # def remove(self, *mobjects: Mobject):
-    #     for mobject in mobjects:
-    #         if mobject not in self.mobjects:
-    #             log.warning(f"Mobject not found: {mobject}")
-    #         else:
-    #             self.mobjects.remove(mobject)
+    def remove(self, *mobjects: Mobject):
+        for mobject in mobjects:
+            if mobject not in self.mobjects:
+                log.warning(f"Mobject not found: {mobject}")
+            else:
+                self.mobjects.remove(mobject)
 
     def get_mobjects_to_display(
         self,
@@ -138,50 +166,13 @@ class Canvas:
                 "Please use `canvas.draw()` instead of `canvas.snapshot` in the browser env."
             )
 
-        bg_rect = None
-        if self.config.bg_color is not None and not ignore_bg:
-            bg_rect = Rectangle(
-                width=self.config.fw,
-                height=self.config.fh,
-                fill_color=self.config.bg_color,
-                z_index=Z_INDEX_MIN,
-                parent=None,
-                subpath="canvas.mobjects[0]",
-            )
-            mobjects_in_order = [bg_rect] + self.get_mobjects_to_display()
-        else:
+        timer = self._start_timer()
+        with timer.span("z_sort"):
+            bg_rect = self._create_bg_rect() if not ignore_bg else None
             mobjects_in_order = self.get_mobjects_to_display()
-        svg_els_lst: List[svg.Element] = []
-        for mobject in mobjects_in_order:
-            svg_func = self.get_to_svg_func(mobject)
-            if svg_func is None:
-                continue
-            new_svg_els = svg_func(mobject)
-            if new_svg_els is not None:
-                svg_els_lst.extend(new_svg_els)
-        if crop:
-            x_munits, y_munits = self.mobjects.get_corner(UL)[:2]
-            buffed_upper_left = np.array(
-                [x_munits - crop_buff, y_munits + crop_buff, 0]
-            )
-            x, y = to_pixel_coords(
-                [buffed_upper_left],
-                config=self.config,
-            )[0]
-
-            w_munits, h_munits = self.mobjects.width, self.mobjects.height
-            w_munits += 2 * crop_buff
-            h_munits += 2 * crop_buff
-            w = to_pixel_len(w_munits, self.config.pw, self.config.fw)
-            h = to_pixel_len(h_munits, self.config.pw, self.config.fw)
-        else:
-            x, y, w, h = 0, 0, self.config.pw, self.config.ph
+            if bg_rect is not None:
+                mobjects_in_order = [bg_rect] + mobjects_in_order
 
-        svg_view_obj = svg.SVG(
-            id="smanim-canvas",
-            viewBox=svg.ViewBoxSpec(x, y, w, h),
-            elements=svg_els_lst,
-        )
         if not overwrite:
             self.num_snapshots += 1
             suffix = self.num_snapshots - 1
@@ -189,26 +180,206 @@ class Canvas:
             suffix = 0
         if manual_suffix is not None:
             suffix = manual_suffix
-        self.save_svg(svg_view_obj, preview=preview, suffix=suffix)
+        fpath = self._get_svg_path(suffix=suffix)
+        with open(fpath, "w") as file:
+            x, y, w, h = self._write_svg(file, mobjects_in_order, crop, crop_buff)
+        if preview:
+            self._open_preview(fpath)
 
         layer_metadatas = {}
-        # include the top canvas layer
-
-        layer_metadatas["canvas"] = self._create_mobject_metadata(
-            mobject=None,
-            id="canvas",
-            mob_type="canvas",
-            parent="None",
-            children=[f"id-{id(mob)}" for mob in self.mobjects],
-        )
+        self.access_path_memo = {}
+        with timer.span("metadata"):
+            # include the top canvas layer
+            layer_metadatas["canvas"] = self._create_mobject_metadata(
+                mobject=None,
+                id="canvas",
+                mob_type="canvas",
+                parent="None",
+                children=[f"id-{id(mob)}" for mob in self.mobjects],
+            )
 
-        for mobject in self.mobjects:
-            self.populate_mobject_metadatas(mobject, layer_metadatas)
-        if bg_rect is not None:
-            self.populate_mobject_metadatas(bg_rect, layer_metadatas, is_bg_rect=True)
+            for mobject in self.mobjects:
+                self.populate_mobject_metadatas(mobject, layer_metadatas)
+            if bg_rect is not None:
+                self.populate_mobject_metadatas(
+                    bg_rect, layer_metadatas, is_bg_rect=True
+                )
+
+        # ids can be reused once mobjects are garbage collected, so don't keep them around
+        self.pixel_coords_index = {}
+        self.pixel_coords_buffer = None
+        self.path_instances = {}
+        self.access_path_memo = {}
 
+        self._finish_timer()
         return (x, y, w, h), layer_metadatas
 
+    def write_svg(
+        self,
+        stream: TextIO,
+        ignore_bg: bool = False,
+        crop: bool = False,
+        crop_buff: float = SMALL_BUFF,
+    ) -> Tuple[float, float, float, float]:
+        """Writes the svg of this canvas to `stream`, which can be any writable text stream.
+        Returns the view box of the svg. Unlike `snapshot`, no metadata is computed.
+        """
+        timer = self._start_timer()
+        with timer.span("z_sort"):
+            bg_rect = self._create_bg_rect() if not ignore_bg else None
+            mobjects_in_order = self.get_mobjects_to_display()
+            if bg_rect is not None:
+                mobjects_in_order = [bg_rect] + mobjects_in_order
+        view_box = self._write_svg(stream, mobjects_in_order, crop, crop_buff)
+        self.pixel_coords_index = {}
+        self.pixel_coords_buffer = None
+        self.path_instances = {}
+        self._finish_timer()
+        return view_box
+
+    def stats(self, ignore_bg: bool = False) -> dict:
+        """Returns the complexity of everything drawn on this canvas, see `get_stats`.
+        Includes the memory of each phase tracked with `track_memory`, if any.
+        """
+        mobjects = self.get_mobjects_to_display(use_z_index=False)
+        bg_rect = self._create_bg_rect() if not ignore_bg else None
+        if bg_rect is not None:
+            mobjects = [bg_rect] + mobjects
+        stats = get_stats(mobjects)
+        if self.memory_deltas:
+            stats["memory"] = dict(self.memory_deltas)
+        return stats
+
+    @contextmanager
+    def track_memory(self, phase: str):
+        """Records the bytes allocated by the code in this block and their peak, with tracemalloc, under `phase` in `stats()`.
+        For example: `with canvas.track_memory("plot"): axes.plot(f)`
+        """
+        started = not tracemalloc.is_tracing()
+        if started:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        start, _ = tracemalloc.get_traced_memory()
+        try:
+            yield
+        finally:
+            end, peak = tracemalloc.get_traced_memory()
+            if started:
+                tracemalloc.stop()
+            self.memory_deltas[phase] = {
+                "delta_bytes": end - start,
+                "peak_bytes": peak - start,
+            }
+
+    def set_timing_callback(
+        self, callback: Callable[[dict[str, float]], None] | None
+    ) -> Canvas:
+        """Calls `callback` after every snapshot with the seconds spent in each phase, see `_start_timer`. Pass None to remove it."""
+        self.timing_callback = callback
+        return self
+
+    def _start_timer(self) -> PhaseTimer:
+        """Starts timing the phases of drawing this canvas, if `track_timings` is set or a timing callback is.
+        Phases: user_code (since the canvas was reset or last drawn), z_sort, pixel_coords, instancing, crop_bbox, svg_elements, file_write and metadata.
+        """
+        enabled = self.config.track_timings or self.timing_callback is not None
+        self.timer = PhaseTimer(enabled)
+        self.timer.add("user_code", perf_counter() - self.user_code_start)
+        return self.timer
+
+    def _finish_timer(self) -> None:
+        self.last_timings = self.timer.timings
+        self.timer = PhaseTimer()
+        if self.timing_callback is not None:
+            self.timing_callback(dict(self.last_timings))
+        self.user_code_start = perf_counter()
+
+    def _create_bg_rect(self) -> Rectangle | None:
+        if self.config.bg_color is None:
+            return None
+        return Rectangle(
+            width=self.config.fw,
+            height=self.config.fh,
+            fill_color=self.config.bg_color,
+            z_index=Z_INDEX_MIN,
+            parent=None,
+            subpath="canvas.mobjects[0]",
+        )
+
+    def _write_svg(
+        self,
+        stream: TextIO,
+        mobjects_in_order: List[Mobject],
+        crop: bool,
+        crop_buff: float,
+    ) -> Tuple[float, float, float, float]:
+        """Streams the svg elements of `mobjects_in_order` to `stream` one at a time, so the document is never held in memory.
+        The repeated paths come first in <defs>, then the elements, then the glyph <defs> and the <style> they reference.
+        """
+        # each svg embeds its own fonts, subset to the chars it uses with `subset_fonts`
+        self.loaded_fonts = set()
+        self.font_chars = {}
+        self.style_classes = {}
+        self.font_faces = []
+        self.glyph_defs = {}
+        if self.config.subset_fonts:
+            for mobject in mobjects_in_order:
+                if isinstance(mobject, Text) and not mobject.as_paths:
+                    chars = self.font_chars.setdefault(str(mobject.font_path), set())
+                    chars.update(mobject.raw_text)
+        timer = self.timer
+        with timer.span("pixel_coords"):
+            self._to_pixel_coords_in_batch(mobjects_in_order)
+        with timer.span("instancing"):
+            path_defs = self._find_repeated_paths(mobjects_in_order)
+
+        with timer.span("crop_bbox"):
+            if crop:
+                x_munits, y_munits = self.mobjects.get_corner(UL)[:2]
+                buffed_upper_left = np.array(
+                    [x_munits - crop_buff, y_munits + crop_buff, 0]
+                )
+                x, y = to_pixel_coords(
+                    [buffed_upper_left],
+                    config=self.config,
+                )[0]
+
+                w_munits, h_munits = self.mobjects.width, self.mobjects.height
+                w_munits += 2 * crop_buff
+                h_munits += 2 * crop_buff
+                w = to_pixel_len(w_munits, self.config.pw, self.config.fw)
+                h = to_pixel_len(h_munits, self.config.pw, self.config.fw)
+            else:
+                x, y, w, h = 0, 0, self.config.pw, self.config.ph
+
+        with timer.span("file_write"):
+            stream.write(
+                f'<svg id="smanim-canvas" xmlns="http://www.w3.org/2000/svg" viewBox="{svg.ViewBoxSpec(x, y, w, h)}">'
+            )
+            if path_defs:
+                stream.write(str(svg.Defs(elements=path_defs)))
+        for mobject in mobjects_in_order:
+            with timer.span("svg_elements"):
+                svg_func = self.get_to_svg_func(mobject)
+                if svg_func is None:
+                    continue
+                new_svg_els = svg_func(mobject)
+                if new_svg_els is None:
+                    continue
+                svg_strs = [str(svg_el) for svg_el in new_svg_els]
+            with timer.span("file_write"):
+                for svg_str in svg_strs:
+                    stream.write(svg_str)
+        with timer.span("file_write"):
+            # <use> can reference glyphs defined later in the document
+            if self.glyph_defs:
+                stream.write(str(svg.Defs(elements=list(self.glyph_defs.values()))))
+            self.glyph_defs = {}
+            # styles are only known once every element is written, css applies to the whole document regardless
+            stream.write(str(self._get_stylesheet()))
+            stream.write("</svg>")
+        return x, y, w, h
+
     # Used in pyodide web environment
     # Since the state of python program is maintained across calls to `runPython`, canvas state must be cleared here
     def draw(
@@ -222,84 +393,140 @@ class Canvas:
             crop_buff=crop_buff,
             called_from_draw=True,
         )
+        result = {"bbox": bbox, "metadata": metadata}
+        if self.config.track_timings:
+            result["timings"] = self.last_timings
         self.reset_canvas(self.config)
-        return json.dumps({"bbox": bbox, "metadata": metadata})
+        return json.dumps(result)
 
     def vmobject_to_svg_el(
         self, vmobject: VMobject, decimal_precision: int = 3
     ) -> Tuple[svg.Element] | None:
-        if len(vmobject.points) == 0:  # handles VGroups
+        # the stored points, since `points` copies them to apply a pending transform
+        if len(vmobject._points) == 0:  # handles VGroups
             return None
-        points = self._to_pixel_coords(
-            vmobject.points, decimal_precision=decimal_precision
-        )
+        styles = {}
+        if vmobject.stroke_opacity and vmobject.stroke_width:
+            styles["stroke"] = (
+                vmobject.stroke_color.value if vmobject.stroke_color else "none"
+            )
+            styles["stroke-width"] = f"{vmobject.stroke_width}px"
+            styles["stroke-opacity"] = str(vmobject.stroke_opacity)
+        if vmobject.fill_opacity is not None:
+            styles["fill-opacity"] = str(vmobject.fill_opacity)
+        styles["fill"] = vmobject.fill_color.value if vmobject.fill_color else "none"
+        styles["stroke-dasharray"] = vmobject.stroke_dasharray
+
+        instance = self.path_instances.get(id(vmobject))
+        if instance is not None:
+            # the shared path has no styles of its own, so it inherits them from the <use>
+            def_id, x, y = instance
+            return (
+                svg.Use(
+                    id=f"id-{id(vmobject)}",
+                    href=f"#{def_id}",
+                    x=x,
+                    y=y,
+                    class_=[self._get_style_class(styles)],
+                ),
+            )
+
+        points = self._get_pixel_coords(vmobject, decimal_precision=decimal_precision)
         if len(points) == 0:
             return
+        return (
+            svg.Path(
+                id=f"id-{id(vmobject)}",
+                d=to_svg_path_data(points, is_closed=vmobject.is_closed),
+                class_=[self._get_style_class(styles)],
+            ),
+        )
 
-        quads = vmobject.get_points_in_quads(points)
-        svg_path = []
-        start = quads[0][0]
-        # assumes a continuous path, no subpaths (for now)
-        svg_path.append(svg.M(*start[:2]))
-        for _p0, p1, p2, p3 in quads:
-            svg_path.append(svg.C(*p1[:2], *p2[:2], *p3[:2]))
-
-        if vmobject.is_closed:
-            svg_path.append(svg.Z())
-        kwargs = {}
-
-        def orNone(value: any):
-            return value if value is not None else "none"
+    def _find_repeated_paths(
+        self, mobjects: List[Mobject], decimal_precision: int = 3
+    ) -> List[svg.Path]:
+        """Finds the vmobjects whose paths are the same up to translation, filling `path_instances`.
+        Returns the shared paths, relative to their first point, to write in <defs>.
+        """
+        self.path_instances = {}
+        if not self.config.instance_repeated_paths:
+            return []
+        # (digest of the path relative to its first point, is_closed) => [(mobject, x, y) of its first point]
+        # only digests are kept, so the geometry of shapes drawn once is not held until the write finishes
+        shapes: dict[Tuple[bytes, bool], List[Tuple[VMobject, float, float]]] = {}
+        for mobject in mobjects:
+            if not isinstance(mobject, VMobject) or len(mobject._points) == 0:
+                continue
+            relative, origin = self._get_relative_pixel_coords(
+                mobject, decimal_precision
+            )
+            if relative is None:
+                continue
+            key = (hashlib.md5(relative.tobytes()).digest(), mobject.is_closed)
+            shapes.setdefault(key, []).append((mobject, *origin.tolist()))
 
-        if vmobject.stroke_opacity and vmobject.stroke_width:
-            kwargs["stroke"] = orNone(
-                None
-                if not vmobject.stroke_color
-                else orNone(vmobject.stroke_color.value)
+        path_defs = []
+        for (_, is_closed), instances in shapes.items():
+            if len(instances) < 2:
+                continue
+            relative, _ = self._get_relative_pixel_coords(
+                instances[0][0], decimal_precision
             )
-            kwargs["stroke_width"] = orNone(vmobject.stroke_width)
-            # Note: stroke_opacity as an svg arg set to "none" creates an opaque effect
-            kwargs["stroke_opacity"] = orNone(vmobject.stroke_opacity)
-        kwargs["fill_opacity"] = orNone(vmobject.fill_opacity)
-        kwargs["fill"] = orNone(
-            None if not vmobject.fill_color else orNone(vmobject.fill_color.value)
+            path_data = to_svg_path_data(relative, is_closed=is_closed)
+            def_id = f"path-{hashlib.md5(path_data.encode('utf-8')).hexdigest()[:10]}"
+            path_defs.append(svg.Path(id=def_id, d=path_data))
+            for mobject, x, y in instances:
+                self.path_instances[id(mobject)] = (def_id, x, y)
+        return path_defs
+
+    def _get_relative_pixel_coords(
+        self, vmobject: VMobject, decimal_precision: int
+    ) -> Tuple[InternalPoint3D_Array | None, Point3D | None]:
+        """Returns the pixel coords of `vmobject` relative to its first point, and that point"""
+        # rounded after subtracting, since rounding first can make translated copies differ in the last digit
+        points = self._get_pixel_coords(vmobject)
+        if len(points) == 0:
+            return None, None
+        origin = points[0]
+        return (
+            np.around(points - origin, decimals=decimal_precision),
+            np.around(origin, decimals=decimal_precision),
         )
-        kwargs["stroke_dasharray"] = vmobject.stroke_dasharray
-
-        return (svg.Path(id=f"id-{id(vmobject)}", d=svg_path, **kwargs),)
 
     def text_to_svg_el(self, text_obj: Text) -> Tuple[svg.Element] | None:
 
-        start_pt = self._to_pixel_coords(text_obj.svg_upper_left)
+        start_pt, center = self._get_pixel_coords(text_obj)
 
         font_family = text_obj.font_family
         italics = text_obj.italics
         bold = text_obj.bold
         font_size = text_obj.font_size
 
-        with open(text_obj.font_path, "rb") as font_file:
-            font_data = font_file.read()
-        base64_font = base64.b64encode(font_data).decode("utf-8")
-
         # can use foreign object to handle max_width and text wrapping in browser envs, but not for local svg
         obj_id = f"id-{id(text_obj)}"
+        if text_obj.as_paths:
+            return self._text_to_glyph_els(text_obj, start_pt, center, obj_id)
 
         family_name_with_style = font_family
         family_name_with_style += "italics" if italics else ""
         family_name_with_style += "bold" if bold else ""
-        font_style_inline_font = dedent(
-            f"""
-            .styleClass-{obj_id} {{
-                text-decoration: {text_obj.text_decoration};
-                fill: {text_obj.fill_color.value};
-                font-size: {font_size}px;
-                fill-opacity: {text_obj.fill_opacity};
-                font-family: {family_name_with_style};
-            }}
-            """
+        style_class = self._get_style_class(
+            {
+                "text-decoration": text_obj.text_decoration,
+                "fill": text_obj.fill_color.value,
+                "font-size": f"{font_size}px",
+                "fill-opacity": str(text_obj.fill_opacity),
+                "font-family": family_name_with_style,
+            }
         )
         if (font_family, italics, bold) not in self.loaded_fonts:
-            font_style_inline_font += f"@font-face {{ font-family: {family_name_with_style}; src: url(data:font/otf;base64,{base64_font}) format('opentype'); }}"
+            chars = None
+            if self.config.subset_fonts:
+                chars = self.font_chars.get(str(text_obj.font_path), text_obj.raw_text)
+            base64_font = get_base64_font(text_obj.font_path, chars)
+            self.font_faces.append(
+                f"@font-face {{ font-family: {family_name_with_style}; src: url(data:font/otf;base64,{base64_font}) format('opentype'); }}"
+            )
             self.loaded_fonts.add((font_family, italics, bold))
 
         text_tspan_objs = []
@@ -326,25 +553,128 @@ class Canvas:
                     dx=text_obj.x_padding_in_pixels,
                 )
             )
-        x_center, y_center = self._to_pixel_coords(text_obj.center)[:2]
+        x_center, y_center = center[:2]
         text_svg_obj = svg.Text(
             id=obj_id,
             elements=text_tspan_objs,
             x=start_pt[0],
             y=start_pt[1],
-            class_=[f"styleClass-{obj_id}"],
+            class_=[style_class],
             # svg transform is clockwise, so negate it
             transform=[
                 svg.Rotate(a=-text_obj.heading * RADIANS, x=x_center, y=y_center)
             ],
         )
 
-        return (svg.Style(text=font_style_inline_font), text_svg_obj)
+        return (text_svg_obj,)
+
+    def _text_to_glyph_els(
+        self,
+        text_obj: Text,
+        start_pt: Point3D,
+        center: Point3D,
+        obj_id: str,
+        decimal_precision: int = 3,
+    ) -> Tuple[svg.Element]:
+        """Draws each line of `text_obj` as <use> references to glyph outlines in <defs>, placed by advance width and kerning.
+        Glyphs are in font units with y pointing up, so each line is a group scaled to the font size and flipped.
+        """
+        metrics = get_glyph_metrics(text_obj.font_path)
+        font_scale = text_obj.font_size / metrics.units_per_em
+        font_name = Path(text_obj.font_path).name
+        style_class = self._get_style_class(
+            {
+                "fill": text_obj.fill_color.value,
+                "fill-opacity": str(text_obj.fill_opacity),
+            }
+        )
+        decoration = metrics.get_decoration(text_obj.text_decoration)
+
+        line_els = []
+        baseline = start_pt[1] + text_obj.y_padding_in_pixels
+        for i, raw_text in enumerate(text_obj.text_tokens):
+            # same line spacing as the tspans of `text_to_svg_el`
+            if i == 0:
+                baseline += text_obj.font_ascent_pixels
+            else:
+                baseline += (
+                    text_obj.font_ascent_pixels
+                    + text_obj.font_descent_pixels
+                    + text_obj.leading_pixels
+                )
+            glyph_els = []
+            pen_positions = metrics.get_pen_positions(raw_text)
+            for char, pen_x in zip(raw_text, pen_positions.tolist()):
+                glyph = metrics.get_glyph(char)
+                path_data = metrics.get_glyph_path(glyph)
+                if not path_data:
+                    continue
+                digest = hashlib.md5(f"{font_name}:{glyph}".encode("utf-8"))
+                def_id = f"glyph-{digest.hexdigest()[:10]}"
+                if def_id not in self.glyph_defs:
+                    self.glyph_defs[def_id] = svg.Path(id=def_id, d=path_data)
+                glyph_els.append(svg.Use(href=f"#{def_id}", x=round(pen_x, 1)))
+            if decoration is not None:
+                decoration_y, thickness = decoration
+                # a font size of units per em keeps the width in font units
+                line_width = metrics.get_width(raw_text, metrics.units_per_em)
+                glyph_els.append(
+                    svg.Rect(
+                        x=0,
+                        y=decoration_y - thickness / 2,
+                        width=round(line_width, 1),
+                        height=thickness,
+                    )
+                )
+            line_x = start_pt[0] + text_obj.x_padding_in_pixels
+            line_els.append(
+                svg.G(
+                    elements=glyph_els,
+                    transform=[
+                        svg.Translate(
+                            round(line_x, decimal_precision),
+                            round(baseline, decimal_precision),
+                        ),
+                        svg.Scale(round(font_scale, 6), round(-font_scale, 6)),
+                    ],
+                )
+            )
+        x_center, y_center = center[:2]
+        text_svg_obj = svg.G(
+            id=obj_id,
+            elements=line_els,
+            class_=[style_class],
+            # svg transform is clockwise, so negate it
+            transform=[
+                svg.Rotate(a=-text_obj.heading * RADIANS, x=x_center, y=y_center)
+            ],
+        )
+        return (text_svg_obj,)
+
+    def _get_style_class(self, styles: dict[str, str]) -> str:
+        """Returns the class name for these css declarations, adding it to the shared stylesheet if needed.
+        Class names are derived from the declarations, so they stay unique when several svgs share a page.
+        """
+        key = tuple(styles.items())
+        if key not in self.style_classes:
+            digest = hashlib.md5(repr(key).encode("utf-8")).hexdigest()[:10]
+            self.style_classes[key] = f"style-{digest}"
+        return self.style_classes[key]
+
+    def _get_stylesheet(self) -> svg.Style:
+        """Returns the <style> with every class used by the svg and its @font-face rules.
+        It is written last in the svg, since the classes are only known once every element is written, see `_write_svg`.
+        """
+        rules = []
+        for declarations, class_name in self.style_classes.items():
+            body = " ".join(f"{prop}: {value};" for prop, value in declarations)
+            rules.append(f".{class_name} {{ {body} }}")
+        return svg.Style(text="\n".join(self.font_faces + rules))
 
     # handles complex mobjects with submobjects as well as groups
     def group_to_svg_el(self, mobject: Mobject, decimal_precision: int = 3):
-        bbox_in_pixels = self._to_pixel_coords(
-            np.array(mobject.bbox), decimal_precision=decimal_precision
+        bbox_in_pixels = self._get_pixel_coords(
+            mobject, decimal_precision=decimal_precision
         )
         ul = bbox_in_pixels[1].tolist()
         width = self._to_pixel_len(mobject.width)
@@ -367,26 +697,58 @@ class Canvas:
         decimal_precision: int | None = None,
     ) -> InternalPoint3D_Array:
         if points.shape == (3,):
-            point = points
             return to_pixel_coords(
-                np.array([point]),
-                self.config.pw,
-                self.config.ph,
-                self.config.fw,
-                self.config.fh,
-                self.config.fc,
+                np.array([points]),
+                config=self.config,
                 decimal_precision=decimal_precision,
             )[0]
-        else:
-            return to_pixel_coords(
-                points,
-                self.config.pw,
-                self.config.ph,
-                self.config.fw,
-                self.config.fh,
-                self.config.fc,
-                decimal_precision=decimal_precision,
+        return to_pixel_coords(
+            points,
+            config=self.config,
+            decimal_precision=decimal_precision,
+        )
+
+    def _get_drawn_points(self, mobject: Mobject) -> InternalPoint3D_Array:
+        """Returns the points of `mobject` that must be converted to pixel coords to draw it"""
+        if isinstance(mobject, Group) or not isinstance(mobject, (VMobject, Text)):
+            return np.array(mobject.bbox)
+        if isinstance(mobject, Text):
+            return np.array([mobject.svg_upper_left, mobject.center])
+        return mobject.points
+
+    def _to_pixel_coords_in_batch(self, mobjects: List[Mobject]) -> None:
+        """Converts the drawn points of all `mobjects` to pixel coords with a single matmul.
+        Each mobject's pixel coords are then a slice of the shared buffer, see `_get_pixel_coords`.
+        The buffer is unrounded, so text anchors can use it too, and slices are rounded when they are read.
+        """
+        self.pixel_coords_index = {}
+        self.pixel_coords_buffer = None
+        drawn_points = [self._get_drawn_points(mob) for mob in mobjects]
+        if len(drawn_points) == 0:
+            return
+        all_points = np.concatenate(drawn_points)
+        if len(all_points) == 0 or not np.all(np.isfinite(all_points)):
+            # non-finite points are handled per mobject by `to_pixel_coords`
+            return
+        self.pixel_coords_buffer = to_pixel_coords(all_points, config=self.config)
+        start = 0
+        for mob, points in zip(mobjects, drawn_points):
+            self.pixel_coords_index[id(mob)] = slice(start, start + len(points))
+            start += len(points)
+
+    def _get_pixel_coords(
+        self, mobject: Mobject, decimal_precision: int | None = None
+    ) -> InternalPoint3D_Array:
+        """Returns the drawn points of `mobject` in pixel coords, using the batch transform when available"""
+        index = self.pixel_coords_index.get(id(mobject))
+        if index is None or self.pixel_coords_buffer is None:
+            return self._to_pixel_coords(
+                self._get_drawn_points(mobject), decimal_precision=decimal_precision
             )
+        points = self.pixel_coords_buffer[index]
+        if decimal_precision is None:
+            return points
+        return np.around(points, decimals=decimal_precision)
 
     def _to_pixel_len(self, value, decimal_precision: int = 3):
         return to_pixel_len(
@@ -416,8 +778,8 @@ class Canvas:
         self, vmobject: VMobject, decimal_precision: int = 3
     ) -> dict:
         """Get the data attributes of this vmobject for the bidirectional editor"""
-        points_in_pixels = self._to_pixel_coords(
-            vmobject.points, decimal_precision=decimal_precision
+        points_in_pixels = self._get_pixel_coords(
+            vmobject, decimal_precision=decimal_precision
         ).tolist()
 
         return self._create_mobject_metadata(
@@ -446,7 +808,9 @@ class Canvas:
         parent: str | None = None,
         points: List[float] | None = None,
     ) -> dict:
-        path, lineno = mobject.get_access_path() if mobject else ("", -1)
+        path, lineno = (
+            mobject.get_access_path(self.access_path_memo) if mobject else ("", -1)
+        )
         path = "None" if path is None else path
         lineno = -1 if lineno is None else lineno
         return MobjectMetadata(
@@ -499,16 +863,21 @@ class Canvas:
         preview: bool = False,
         suffix: int | str = "",
     ):
-        self.config.mk_save_dir_if_not_exists()
-        script_dir = Path(self.config.save_file_dir)
-        fpath = script_dir / f"{name}{suffix}.svg"
-
+        fpath = self._get_svg_path(name=name, suffix=suffix)
         with open(fpath, "w") as file:
             file.write(str(svg_obj))
         if preview:
-            if BROWSER_ENV:
-                raise Exception("Cannot open a preview while running in a browser env")
-            subprocess.run(["open", fpath])
+            self._open_preview(fpath)
+
+    def _get_svg_path(self, name: str = "test", suffix: int | str = "") -> Path:
+        self.config.mk_save_dir_if_not_exists()
+        script_dir = Path(self.config.save_file_dir)
+        return script_dir / f"{name}{suffix}.svg"
+
+    def _open_preview(self, fpath: Path):
+        if BROWSER_ENV:
+            raise Exception("Cannot open a preview while running in a browser env")
+        subprocess.run(["open", fpath])
 
     # Transformations on canvas apply directly to its group
     # Slightly misleading since canvas does not scale itself
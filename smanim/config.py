@@ -1,5 +1,6 @@
 import os
 from pathlib import Path
+import numpy as np
 from smanim.constants import DEFAULT_FONT_SIZE, LOW_RES, ORIGIN
 from smanim.utils.color import BLACK, WHITE, ManimColor
 
@@ -45,6 +46,13 @@ class Config:
         default_text_color: ManimColor = WHITE,
         default_text_font_size: int = DEFAULT_FONT_SIZE,
         default_text_font_family: str = "computer-modern",
+        lazy_transforms: bool = False,
+        track_lineno: bool = True,
+        instance_repeated_paths: bool = True,
+        arc_tolerance: float | None = None,
+        text_as_paths: bool = False,
+        track_timings: bool = False,
+        subset_fonts: bool = False,
     ):
         DEFAULT_DENSITY = LOW_RES
         DEFAULT_FRAME_HEIGHT = 8
@@ -65,10 +73,38 @@ class Config:
         self.pw = int(self.fw * self.density)  # pixel width
         self.ph = int(self.fh * self.density)  # pixel height
         self.mk_dir_attempted = False
+        self._pixel_transform_key = None
 
         self.default_text_color = default_text_color
         self.default_text_font_size = default_text_font_size
         self.default_text_font_family = default_text_font_family
+        # when set, vmobjects accumulate transforms as a pending affine map and only transform their points when read
+        self.lazy_transforms = lazy_transforms
+        # when unset, canvas additions skip looking up the caller's line number for the bidirectional metadata
+        self.track_lineno = track_lineno
+        # when set, paths drawn more than once (up to translation) are written once in <defs> and referenced with <use>
+        self.instance_repeated_paths = instance_repeated_paths
+        # when set, arcs without an explicit `num_components` use the fewest curves within this many pixels of the true arc
+        self.arc_tolerance = arc_tolerance
+        # when set, text is drawn from glyph outlines shared in <defs>, instead of <text> with an embedded font
+        self.text_as_paths = text_as_paths
+        # when set, the seconds spent in each phase of a snapshot are kept in `canvas.last_timings` and returned by `canvas.draw()`
+        self.track_timings = track_timings
+        # when set, embedded fonts are subset to the chars each svg draws, which is smaller but costs ~50ms per new set of chars
+        self.subset_fonts = subset_fonts
+
+    @property
+    def pixel_transform(self) -> np.ndarray:
+        """The affine matrix from manim coords to pixel coords, cached until the frame changes"""
+        key = (self.pw, self.ph, self.fw, self.fh, self.fc[0], self.fc[1])
+        if key != self._pixel_transform_key:
+            from smanim.utils.space_ops import get_pixel_transform
+
+            self._pixel_transform = get_pixel_transform(
+                self.pw, self.ph, self.fw, self.fh, self.fc
+            )
+            self._pixel_transform_key = key
+        return self._pixel_transform
 
     def mk_save_dir_if_not_exists(self):
         if self.mk_dir_attempted:
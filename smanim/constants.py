@@ -74,3 +74,4 @@ HIGH_RES = 120  # 120 pixels per unit
 DEFAULT_STROKE_WIDTH = 4.0
 DEFAULT_ARROW_TIP_LENGTH = 0.35
 DEFAULT_DOT_RADIUS = 0.08
+DEFAULT_ARC_COMPONENTS = 30
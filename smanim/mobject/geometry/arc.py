@@ -1,10 +1,13 @@
 from __future__ import annotations
+from functools import lru_cache
+import math
 import numpy as np
-from smanim.constants import ORIGIN, RIGHT, TAU, UP
+from smanim.config import CONFIG
+from smanim.constants import DEFAULT_ARC_COMPONENTS, ORIGIN, TAU
 from smanim.mobject.vmobject import VMobject
-from smanim.typing import Point3D
+from smanim.typing import InternalPoint3D_Array, Point3D
 from smanim.utils.color import BLUE, has_default_colors_set
-from smanim.utils.space_ops import angle_from_vector
+from smanim.utils.space_ops import angle_from_vector, read_only
 
 
 __all__ = ["Arc"]
@@ -19,7 +22,9 @@ class Arc(VMobject):
         # Weakness: Setting num_components to a high value (instead of like 9) creates many more curves and a more accurate bounding polygon
         # This is necessary for realistic-looking intersection detection
         # FUTURE: Potentially do exact intersections in the future?
-        num_components: float = 30,
+        # When None, uses DEFAULT_ARC_COMPONENTS, or the fewest within `CONFIG.arc_tolerance` pixels if it is set
+        # Adaptive arcs keep a bounding polygon with DEFAULT_ARC_COMPONENTS anchors for intersections
+        num_components: int | None = None,
         arc_center: Point3D = ORIGIN,
         **kwargs,
     ):
@@ -31,40 +36,30 @@ class Arc(VMobject):
         self.arc_center: Point3D = arc_center
         self.start_angle = start_angle
         self.angle = angle
-        self.num_components = num_components
+        if num_components is None and CONFIG.arc_tolerance is not None:
+            num_components = get_adaptive_num_components(
+                radius, angle, CONFIG.arc_tolerance / CONFIG.density
+            )
+        self.num_components = (
+            num_components if num_components is not None else DEFAULT_ARC_COMPONENTS
+        )
         super().__init__(is_closed=angle == TAU, **kwargs)
 
     def generate_points(self) -> None:  # override
-        anchors = np.array(
-            [
-                np.cos(a) * RIGHT + np.sin(a) * UP
-                for a in np.linspace(
-                    self.start_angle,
-                    self.start_angle + self.angle,
-                    self.num_components,
-                )
-            ],
+        # arcs with the same angles share one unit arc, with the radius and center kept as a transform
+        bounding_points = None
+        if self.num_components < DEFAULT_ARC_COMPONENTS:
+            bounding_points = get_unit_arc_anchors(
+                self.start_angle, self.angle, DEFAULT_ARC_COMPONENTS
+            )
+        self.set_shared_points(
+            get_unit_arc_points(self.start_angle, self.angle, self.num_components),
+            bounding_points,
         )
-        # Use tangent lines to generate control points
-        d_theta = self.angle / (self.num_components - 1.0)
-        tangent_vectors = np.zeros(anchors.shape)
-        # Rotate all 90 degrees, via (x, y) -> (-y, x)
-        tangent_vectors[:, 1] = anchors[:, 0]
-        tangent_vectors[:, 0] = -anchors[:, 1]
-        # For each anchor pair a1, a2, use tangent at a1 for first handle and tangent at a2 (in opposite direction) for second handle
-        handles1 = anchors[:-1] + (d_theta / 3) * tangent_vectors[:-1]
-        handles2 = anchors[1:] - (d_theta / 3) * tangent_vectors[1:]
-        new_points = np.array(
-            [
-                p
-                for pair in zip(anchors[:-1], handles1, handles2, anchors[1:])
-                for p in pair
-            ]
+        # scale by the radius and shift to the center in one step
+        self._add_pending_transform(
+            np.eye(3) * self.radius, np.asarray(self.arc_center, dtype=float)
         )
-        self.points = new_points
-
-        self.scale(self.radius)
-        self.shift(self.arc_center)
 
     def __repr__(self):
         class_name = self.__class__.__qualname__
@@ -105,3 +100,62 @@ class Arc(VMobject):
             arc_center=arc_center,
             **kwargs,
         )
+
+
+@lru_cache(maxsize=1024)
+def get_unit_arc_points(
+    start_angle: float, angle: float, num_components: int
+) -> InternalPoint3D_Array:
+    """Returns the read-only bezier points of an arc with radius 1 centered at the origin"""
+    angles = np.linspace(start_angle, start_angle + angle, num_components)
+    anchors = np.zeros((len(angles), 3))
+    anchors[:, 0] = np.cos(angles)
+    anchors[:, 1] = np.sin(angles)
+    # Use tangent lines to generate control points
+    d_theta = angle / (num_components - 1.0)
+    tangent_vectors = np.zeros(anchors.shape)
+    # Rotate all 90 degrees, via (x, y) -> (-y, x)
+    tangent_vectors[:, 1] = anchors[:, 0]
+    tangent_vectors[:, 0] = -anchors[:, 1]
+    # For each anchor pair a1, a2, use tangent at a1 for first handle and tangent at a2 (in opposite direction) for second handle
+    handles1 = anchors[:-1] + (d_theta / 3) * tangent_vectors[:-1]
+    handles2 = anchors[1:] - (d_theta / 3) * tangent_vectors[1:]
+    # interleave into (a1, h1, h2, a2) for each curve
+    points = np.stack([anchors[:-1], handles1, handles2, anchors[1:]], axis=1).reshape(
+        -1, 3
+    )
+    return read_only(points)
+
+
+@lru_cache(maxsize=1024)
+def get_unit_arc_anchors(
+    start_angle: float, angle: float, num_components: int
+) -> InternalPoint3D_Array:
+    """Returns the read-only anchors of a unit arc, including the end anchor unless the arc is closed"""
+    points = get_unit_arc_points(start_angle, angle, num_components)
+    anchors = points[:: VMobject.points_per_curve]
+    if angle != TAU:
+        anchors = np.append(anchors, points[-1:], axis=0)
+    return read_only(anchors)
+
+
+def get_arc_error(radius: float, d_theta: float) -> float:
+    """Returns the max distance between a circle and each curve spanning `d_theta` of it.
+    With handles of length `d_theta / 3`, the curves fall inside the circle, furthest from it at their midpoints.
+    """
+    half = d_theta / 2
+    return radius * (1 - math.cos(half) - (d_theta / 4) * math.sin(half))
+
+
+@lru_cache(maxsize=1024)
+def get_adaptive_num_components(radius: float, angle: float, tolerance: float) -> int:
+    """Returns the fewest anchors such that the curves of an arc stay within `tolerance` of it, in the same units as `radius`"""
+    radius, angle = abs(radius), abs(angle)
+    if radius == 0 or angle == 0 or tolerance <= 0:
+        return DEFAULT_ARC_COMPONENTS
+    # the error is about radius * d_theta**4 / 384 for small angles, so start there and correct upwards
+    d_theta = (384 * tolerance / radius) ** 0.25
+    num_curves = max(1, math.ceil(angle / d_theta))
+    while get_arc_error(radius, angle / num_curves) > tolerance:
+        num_curves += 1
+    return num_curves + 1
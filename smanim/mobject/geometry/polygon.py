@@ -1,4 +1,4 @@
-from typing import List
+from functools import lru_cache
 from typing_extensions import Self
 import numpy as np
 from smanim.mobject.geometry.arc import Arc
@@ -6,8 +6,15 @@ from smanim.utils.bezier import interpolate
 from smanim.utils.color import BLUE, GREEN, has_default_colors_set
 from smanim.constants import DL, DR, ORIGIN, OUT, PI, UL, UR
 from smanim.mobject.vmobject import VMobject
-from smanim.typing import ManimFloat, Point3D, Point3D_Array, QuadArray_Point3D, Vector3
-from smanim.utils.space_ops import regular_vertices
+from smanim.typing import (
+    InternalPoint3D_Array,
+    ManimFloat,
+    Point3D,
+    Point3D_Array,
+    QuadArray_Point3D,
+    Vector3,
+)
+from smanim.utils.space_ops import read_only, regular_vertices
 from smanim.utils.logger import log
 
 __all__ = [
@@ -35,11 +42,7 @@ class Polygram(VMobject):
 
     def generate_points(self) -> None:
         """Override to generate points by interpolating between each pair of vertices"""
-        points: List[Point3D] = []
-        for start, end in zip(self.vertices, self.vertices[1:]):
-            quad = self.gen_bezier_quad_from_line(start, end)
-            points.extend(quad)
-        self.points = np.array(points, dtype=ManimFloat)
+        self.set_shared_points(get_polygram_points(self.vertices.tobytes(), False))
 
     @property
     def vertices(self) -> Point3D_Array:
@@ -71,31 +74,19 @@ class Polygram(VMobject):
         about_point: Point3D | None = ORIGIN,
     ) -> Self:
         self.vertices = super().rotate_points(self.vertices, angle, axis, about_point)
-        self.points = super().rotate_points(self.points, angle, axis, about_point)
-        for mob in self.submobjects:
-            mob.rotate(angle, axis, about_point)
-        return self
+        return super().rotate(angle, axis, about_point)
 
     def scale(self, factor: float, about_point: Point3D | None = ORIGIN) -> Self:
         self.vertices = super().scale_points(self.vertices, factor, about_point)
-        self.points = super().scale_points(self.points, factor, about_point)
-        for mob in self.submobjects:
-            mob.scale(factor, about_point)
-        return self
+        return super().scale(factor, about_point)
 
     def stretch(self, factor: float, dim: int) -> Self:
         self.vertices = super().stretch_points(self.vertices, factor, dim)
-        self.points = super().stretch_points(self.points, factor, dim)
-        for mob in self.submobjects:
-            mob.stretch(factor, dim)
-        return self
+        return super().stretch(factor, dim)
 
     def shift(self, vector: Vector3) -> Self:
         self.vertices = super().shift_points(self.vertices, vector)
-        self.points = super().shift_points(self.points, vector)
-        for mob in self.submobjects:
-            mob.shift(vector)
-        return self
+        return super().shift(vector)
 
 
 class Polygon(Polygram):
@@ -114,13 +105,8 @@ class Polygon(Polygram):
             self.rounded = True
 
     def generate_points(self) -> None:
-        """Override to generate points by interpolating between each pair of vertices"""
-        points: List[Point3D] = []
-        vertices_behind = np.roll(self.vertices, -1, axis=0)
-        for start, end in zip(self.vertices, vertices_behind):
-            quad = self.gen_bezier_quad_from_line(start, end)
-            points.extend(quad)
-        self.points = np.array(points, dtype=ManimFloat)
+        """Override to generate points by interpolating between each pair of vertices, including the last and first"""
+        self.set_shared_points(get_polygram_points(self.vertices.tobytes(), True))
 
     def round_corners(self, radius: float) -> None:
         """Applies surgery to the polygon, reducing the existing lines and inserting the arcs at the corners.
@@ -220,3 +206,18 @@ class Triangle(RegularPolygon):
     def __init__(self, side_length: float = 2.0, **kwargs) -> None:
         half_side = side_length / 2
         super().__init__(n=3, radius=half_side, **kwargs)
+
+
+@lru_cache(maxsize=1024)
+def get_polygram_points(vertices: bytes, is_closed: bool) -> InternalPoint3D_Array:
+    """Returns the read-only bezier points of lines between each pair of `vertices`, given as the bytes of a float array.
+    Keyed by bytes so polygons with the same vertices share their points.
+    """
+    vertices = np.frombuffer(vertices, dtype=ManimFloat).reshape(-1, 3)
+    if is_closed:
+        starts, ends = vertices, np.roll(vertices, -1, axis=0)
+    else:
+        starts, ends = vertices[:-1], vertices[1:]
+    alphas = np.linspace(0, 1, VMobject.points_per_curve)[None, :, None]
+    points = interpolate(starts[:, None, :], ends[:, None, :], alphas).reshape(-1, 3)
+    return read_only(points)
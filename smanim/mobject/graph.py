@@ -15,12 +15,14 @@ __all__ = ["Graph", "WeightedGraph"]
 from copy import copy
 from typing import Dict, Hashable, Iterable, List, Tuple
 
-import networkx as nx
 import numpy as np
 
 from smanim.mobject.geometry.line import Arrow, Line
 from smanim.mobject.group import Group
 from smanim.mobject.mobject import Mobject
+from smanim.utils.import_ops import lazy_import
+
+nx = lazy_import("networkx")
 
 
 class Graph(TransformableMobject):
@@ -49,15 +49,20 @@ class AccessPath(NamedTuple):
     subpath: str | None = None
     parent: Mobject | None = None
     lineno: int | None = None  # only set on top-level assignments
-    mob_id: int | None = None  # only set by group additions
+    mob_id: int | None = None  # only set by group and canvas additions
     # mob_id is used to generate index at retrieval using `parent._index_of_submobject(mob_id)`
 
 
+# cached as the family bounds of mobjects whose family has no bounding points, unlike None which means not cached
+NO_FAMILY_BOUNDS = ()
+
+
 class Mobject(ABC):
     """Base class for all objects that take up space.
     Note: This class has been modified to support bidirectional editing.
     `bounding_points` represents the bounding polygon for this mobject (they do not include submobjects).
     Subclasses are responsible for setting the `bounding_points`.
+    The axis-aligned bounds of the family are cached, and invalidated up through all parents when points or submobjects change.
     """
 
     def __init__(
@@ -73,6 +78,16 @@ class Mobject(ABC):
         self._bounding_points = bounding_points
         self.z_index = z_index
         self.submobjects: List[Mobject] = []
+        # id of submobject => its index in `submobjects` plus `_submobject_index_offset`, or None if it must be rebuilt
+        # the offset lets mobjects be inserted at or removed from the front without shifting every index
+        self._submobject_indices: dict[int, int] | None = {}
+        self._submobject_index_offset = 0
+        # the list the indices were built for, so they are rebuilt if `submobjects` is reassigned
+        self._indexed_submobjects: List[Mobject] | None = self.submobjects
+        # every mobject that has this one as a submobject, used to invalidate their cached bounds
+        self.parents: List[Mobject] = []
+        # (min, max) corners of the family's bounding points, or None if not computed yet
+        self._family_bounds: Tuple[Point3D, Point3D] | None = None
 
         # used for bidirectional editing
         self.access_paths: List[AccessPath] = []
@@ -92,9 +107,67 @@ class Mobject(ABC):
     @bounding_points.setter
     def bounding_points(self, bounding_points: InternalPoint3D_Array):
         self._bounding_points = bounding_points
+        self._invalidate_family_bounds()
+
+    def _invalidate_family_bounds(self) -> None:
+        # if the bounds are not cached, then neither are the bounds of any ancestor
+        # this holds since computing the bounds of a mobject caches them for all its submobjects, even empty ones
+        if self._family_bounds is None:
+            return
+        self._family_bounds = None
+        for parent in self.parents:
+            parent._invalidate_family_bounds()
+
+    def _get_cached_family_bounds(self) -> Tuple[Point3D, Point3D] | None:
+        """Returns the family bounds, or None if the family has no bounding points. Either result is cached."""
+        if self._family_bounds is None:
+            mins, maxes = [], []
+            bounding_points = self.bounding_points
+            if len(bounding_points) > 0:
+                mins.append(np.min(bounding_points, axis=0))
+                maxes.append(np.max(bounding_points, axis=0))
+            for mob in self.submobjects:
+                mob_bounds = mob._get_cached_family_bounds()
+                if mob_bounds is not None:
+                    mins.append(mob_bounds[0])
+                    maxes.append(mob_bounds[1])
+            if len(mins) == 0:
+                self._family_bounds = NO_FAMILY_BOUNDS
+            else:
+                self._family_bounds = (np.min(mins, axis=0), np.max(maxes, axis=0))
+        if len(self._family_bounds) == 0:  # NO_FAMILY_BOUNDS
+            return None
+        return self._family_bounds
+
+    def get_family_bounds(self) -> Tuple[Point3D, Point3D]:
+        """Returns the (min, max) corners of the bounding points of this mobject and all its submobjects"""
+        family_bounds = self._get_cached_family_bounds()
+        if family_bounds is None:
+            raise ValueError(
+                f"Cannot get the bounds of a mobject without any bounding points: {self}"
+            )
+        return family_bounds
+
+    def has_family_points(self) -> bool:
+        return self._get_cached_family_bounds() is not None
 
-    def get_access_path(self) -> Tuple[str | None, int | None]:
-        """Return the first valid access path and its corresponding lineno"""
+    def get_access_path(
+        self, memo: dict[int, Tuple[str | None, int | None]] | None = None
+    ) -> Tuple[str | None, int | None]:
+        """Return the first valid access path and its corresponding lineno.
+        `memo` maps mobject ids to their resolved access paths. Share it when resolving many mobjects,
+        so each parent is only resolved once. It is only valid while no mobjects are added, removed or reassigned.
+        """
+        if memo is None:
+            return self._resolve_access_path(memo)
+        key = id(self)
+        if key not in memo:
+            memo[key] = self._resolve_access_path(memo)
+        return memo[key]
+
+    def _resolve_access_path(
+        self, memo: dict[int, Tuple[str | None, int | None]] | None
+    ) -> Tuple[str | None, int | None]:
         access_type_precedence = {
             AccessType.TOP_LEVEL_ASSIGN: 0,
             AccessType.MANUAL_ASSIGN: 1,
@@ -115,12 +188,12 @@ class Mobject(ABC):
             elif access_type == AccessType.MANUAL_ASSIGN:
                 if not parent:
                     return subpath, lineno
-                parent_path, parent_lineno = parent.get_access_path()
+                parent_path, parent_lineno = parent.get_access_path(memo)
                 path = parent_path + subpath if parent_path is not None else subpath
                 lineno = parent_lineno if lineno is None else lineno
                 return path, lineno
             elif access_type == AccessType.ADD_TO_GROUP:
-                parent_path, parent_lineno = parent.get_access_path()
+                parent_path, parent_lineno = parent.get_access_path(memo)
                 if not mob_id:
                     raise AttributeError(
                         f"Add to group paths must have a mobject id. Mobject is {self}"
@@ -131,54 +204,136 @@ class Mobject(ABC):
 
                 # Generate subpath dynamically for mobjects in groups by finding their index
                 index = parent._index_of_submobject(mob_id)
+                if index == -1:
+                    # removed from the group since
+                    continue
                 subpath = f"[{index}]"
                 if lineno is None:
                     lineno = parent_lineno
                 return parent_path + subpath, lineno
             elif access_type == AccessType.ADD_TO_CANVAS:
-                return subpath, lineno
+                # `parent` is the canvas group, so the index stays valid after removals
+                index = parent._index_of_submobject(mob_id)
+                if index == -1:
+                    continue
+                return f"{subpath}[{index}]", lineno
             else:
                 raise TypeError("Invalid access type")
         return None, None
 
     # Grouping
+    # Note: `add` and `remove` keep `_submobject_indices` valid, other changes to `submobjects` are detected on lookup
+    def _get_submobject_indices(self) -> dict[int, int]:
+        if (
+            self._submobject_indices is None
+            or self._indexed_submobjects is not self.submobjects
+            or len(self._submobject_indices) != len(self.submobjects)
+        ):
+            self._submobject_indices = {
+                id(mob): index for index, mob in enumerate(self.submobjects)
+            }
+            self._submobject_index_offset = 0
+            self._indexed_submobjects = self.submobjects
+        return self._submobject_indices
+
+    def has_submobject(self, mobject: Mobject) -> bool:
+        """Returns whether `mobject` is a direct submobject of this mobject, in constant time"""
+        index = self._index_of_submobject(id(mobject))
+        return index != -1 and self.submobjects[index] is mobject
+
+    def __contains__(self, mobject: Mobject) -> bool:
+        return self.has_submobject(mobject)
+
+    def __setstate__(self, state: dict):
+        # ids of submobjects change when copied, so the indices must be rebuilt
+        self.__dict__.update(state)
+        self._submobject_indices = None
+        self._indexed_submobjects = None
+
     def add(self, *mobjects: Mobject, insert_at_front: bool = False) -> Self:
         new_mobjects = []
+        new_ids = set()
         for mobject in mobjects:
             if mobject is self:
                 raise ValueError("Cannot add mobject to itself")
-            if mobject in self.submobjects:
+            if self.has_submobject(mobject) or id(mobject) in new_ids:
                 log.warning(f"Mobject already added: {mobject}")
             else:
                 new_mobjects.append(mobject)
+                new_ids.add(id(mobject))
                 new_access_path = AccessPath(
                     type=AccessType.ADD_TO_GROUP,
                     parent=self,
                     mob_id=id(mobject),
                 )
                 mobject.access_paths.append(new_access_path)
+                mobject.parents.append(self)
+        indices = self._get_submobject_indices()
         if not insert_at_front:
-            self.submobjects.extend(new_mobjects)
+            for mobject in new_mobjects:
+                indices[id(mobject)] = (
+                    len(self.submobjects) + self._submobject_index_offset
+                )
+                self.submobjects.append(mobject)
         else:
-            self.submobjects = new_mobjects + self.submobjects
+            # moving the offset shifts the index of every existing submobject at once
+            self._submobject_index_offset -= len(new_mobjects)
+            for i, mobject in enumerate(new_mobjects):
+                indices[id(mobject)] = i + self._submobject_index_offset
+            self.submobjects[:0] = new_mobjects
+        if new_mobjects:
+            self._invalidate_family_bounds()
         return self
 
-    def _index_of_submobject(self, sub_mob_id: str):
-        for index, sub_mob in enumerate(self.submobjects):
-            if id(sub_mob) == sub_mob_id:
-                return index
-        return -1
+    def _index_of_submobject(self, sub_mob_id: int) -> int:
+        indices = self._get_submobject_indices()
+        if sub_mob_id not in indices:
+            return -1
+        index = indices[sub_mob_id] - self._submobject_index_offset
+        if id(self.submobjects[index]) != sub_mob_id:
+            # `submobjects` was reordered in place, e.g. by swapping two of them
+            self._submobject_indices = None
+            return self._get_submobject_indices().get(sub_mob_id, -1)
+        return index
 
     def remove(self, *mobjects: Mobject) -> Self:
+        to_remove = set()
         for mobject in mobjects:
             if mobject is self:
                 log.error("Cannot remove mobject from itself")
-            if mobject not in self.submobjects:
+            if not self.has_submobject(mobject) or id(mobject) in to_remove:
                 log.warning(f"Mobject not found: {mobject}")
             else:
-                self.submobjects.remove(mobject)
+                to_remove.add(id(mobject))
+                mobject.parents.remove(self)
+        if len(to_remove) == 1:
+            (removed_id,) = to_remove
+            self._remove_submobject_at(self._index_of_submobject(removed_id))
+        elif to_remove:
+            # a single pass, so removing many mobjects at once stays linear
+            self.submobjects[:] = [
+                mob for mob in self.submobjects if id(mob) not in to_remove
+            ]
+            self._submobject_indices = None
+        if to_remove:
+            self._invalidate_family_bounds()
         return self
 
+    def _remove_submobject_at(self, index: int) -> None:
+        """Removes the submobject at `index`, updating the indices on whichever side of it is shorter.
+        So removing the first or last submobject, like `bring_to_back` and `bring_to_front` do, updates no other index.
+        """
+        indices = self._get_submobject_indices()
+        del indices[id(self.submobjects[index])]
+        del self.submobjects[index]
+        if index < len(self.submobjects) - index:
+            for mob in self.submobjects[:index]:
+                indices[id(mob)] += 1
+            self._submobject_index_offset += 1
+        else:
+            for mob in self.submobjects[index:]:
+                indices[id(mob)] -= 1
+
     def get_family(self):
         family = [self]
         for s in self.submobjects:
@@ -191,6 +346,12 @@ class Mobject(ABC):
             cur_family.extend(s.get_family_members_of_type(member_type))
         return cur_family
 
+    def stats(self) -> dict:
+        """Returns the complexity of this mobject and its submobjects, see `get_stats`"""
+        from smanim.utils.stats_ops import get_stats
+
+        return get_stats(self.get_family())
+
     # Bounding Box Ops
     def get_critical_point(self, direction: Vector3):
         """9 point bbox: 4 corners, 4 edge points, 1 center"""
@@ -200,12 +361,7 @@ class Mobject(ABC):
                 f"Direction is {direction} but must be [x, x, (optional)] where x is -1, 0, 1. See constants.py for direction values."
             )
 
-        all_points = np.concatenate(
-            [mob.bounding_points for mob in self.get_family()], axis=0
-        )
-
-        x_min, y_min, _ = np.min(all_points, axis=0)
-        x_max, y_max, _ = np.max(all_points, axis=0)
+        (x_min, y_min, _), (x_max, y_max, _) = self.get_family_bounds()
         x_mid, y_mid = x_min + (x_max - x_min) / 2, y_min + (y_max - y_min) / 2
         # bbox_dirs = [UL, UP, UR, RIGHT, DR, DOWN, DL, LEFT, ORIGIN]
         x_dir = [x_min, x_mid, x_max]
@@ -488,7 +644,62 @@ class Mobject(ABC):
 
     # Frequently used patterns
     def copy(self) -> Mobject:
-        return deepcopy(self)
+        """Copies this mobject and its submobjects, without walking into the groups it belongs to.
+        Read-only arrays (e.g. `points`) are shared, since they can only be replaced and never modified in place.
+        Access paths are rewritten onto the copied family, and paths through mobjects outside of it are dropped.
+        """
+        # the copy is not a submobject of anything yet
+        return self._copy_family({})
+
+    def _copy_family(self, memo: dict[int, object]) -> Mobject:
+        """Copies the family of this mobject that is not in `memo` yet, see `copy`.
+        `memo` maps object ids to their copies, shared with deepcopy so references within the family point at the copies.
+        """
+        family = list({id(mob): mob for mob in self.get_family()}.values())
+        family = [mob for mob in family if id(mob) not in memo]
+        for mob in family:
+            memo[id(mob)] = mob.__class__.__new__(mob.__class__)
+        for mob in family:
+            mob._copy_into(memo[id(mob)], memo)
+        # submobjects copied earlier by the same deepcopy did not know their copied parents yet
+        for mob in family:
+            copied = memo[id(mob)]
+            for submob in copied.submobjects:
+                if not any(parent is copied for parent in submob.parents):
+                    submob.parents.append(copied)
+        return memo[id(self)]
+
+    def _copy_into(self, mobject: Mobject, memo: dict[int, object]) -> None:
+        for key, value in self.__dict__.items():
+            if key in (
+                "parents",
+                "access_paths",
+                "_submobject_indices",
+                "_indexed_submobjects",
+            ):
+                continue
+            if isinstance(value, np.ndarray) and not value.flags.writeable:
+                mobject.__dict__[key] = value
+            else:
+                mobject.__dict__[key] = deepcopy(value, memo)
+        mobject.parents = [memo[id(p)] for p in self.parents if id(p) in memo]
+        mobject._submobject_indices = None
+        mobject._indexed_submobjects = None
+        mobject.access_paths = []
+        for access_path in self.access_paths:
+            if access_path.parent is None:
+                mobject.access_paths.append(access_path)
+            elif id(access_path.parent) in memo:
+                mobject.access_paths.append(
+                    access_path._replace(
+                        parent=memo[id(access_path.parent)],
+                        mob_id=None if access_path.mob_id is None else id(mobject),
+                    )
+                )
+
+    def __deepcopy__(self, memo: dict) -> Mobject:
+        # mobjects referenced from outside a copied family are copied structurally as well
+        return self._copy_family(memo)
 
     def _require_direction_as_bbox(self, direction: Vector3):
         if not any(
@@ -7,10 +7,11 @@ from smanim.mobject.text.text_mobject import Text
 from smanim.typing import Point3D
 from smanim.utils.color import WHITE, ManimColor, has_default_colors_set
 
-import svgelements as se
-
+from smanim.utils.import_ops import lazy_import
 from smanim.utils.space_ops import angle_from_vector
 
+se = lazy_import("svgelements")
+
 __all__ = ["Brace", "LabeledBrace"]
 
 path_string_template = (
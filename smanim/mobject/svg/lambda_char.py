@@ -1,10 +1,12 @@
+from __future__ import annotations
 from smanim.mobject.group import Group
 from smanim.mobject.svg.svg_mobject import VMobjectFromSVGPath
 from smanim.mobject.text.text_mobject import Text
-import svgelements as se
-
+from smanim.utils.import_ops import lazy_import
 from smanim.utils.color import BLUE, WHITE
 
+se = lazy_import("svgelements")
+
 __all__ = ["Lambda", "LambdaWithEyes"]
 
 # lambda_path = "M 546.142 329.632 C 546.583 329.632 547.024 329.632 547.465 329.632 C 547.465 333.509 546.834 336.331 545.572 338.098 C 544.309 339.865 542.734 340.748 540.846 340.748 C 539.301 340.748 537.818 340.166 536.396 339.0 C 534.974 337.834 533.699 334.712 532.572 329.632 C 531.517 324.871 530.463 320.11 529.409 315.35 C 525.756 323.644 522.103 331.939 518.45 340.233 C 516.134 340.233 513.817 340.233 511.5 340.233 C 516.747 328.92 521.993 317.607 527.24 306.294 C 526.406 301.902 525.401 298.65 524.224 296.54 C 523.047 294.429 521.588 293.374 519.848 293.374 C 518.45 293.374 517.231 293.908 516.189 294.975 C 515.147 296.043 514.565 297.693 514.442 299.926 C 514.001 299.926 513.559 299.926 513.118 299.926 C 513.192 296.319 513.915 293.429 515.288 291.258 C 516.661 289.086 518.377 288.0 520.436 288.0 C 521.76 288.0 523.017 288.546 524.206 289.638 C 525.395 290.73 526.424 292.595 527.295 295.233 C 528.165 297.871 529.519 303.338 531.358 311.632 C 532.229 315.521 533.099 319.411 533.969 323.301 C 535.023 328.135 536.133 331.368 537.297 333.0 C 538.462 334.632 539.853 335.448 541.471 335.448 C 544.217 335.448 545.774 333.509 546.142 329.632 C 546.142 329.632 546.142 329.632 546.142 329.632 Z "
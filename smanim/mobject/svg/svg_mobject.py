@@ -1,10 +1,12 @@
+from __future__ import annotations
 from typing import List
 import numpy as np
 from smanim.mobject.vmobject import VMobject
-import svgelements as se
-
+from smanim.utils.import_ops import lazy_import
 from smanim.typing import ManimFloat, Point3D
 
+se = lazy_import("svgelements")
+
 __all__ = ["VMobjectFromSVGPath"]
 
 
@@ -13,8 +13,7 @@ from smanim.mobject.transformable import TransformableMobject
 from smanim.typing import Point3D, Vector3
 from smanim.utils.color import ManimColor
 from smanim.utils.space_ops import to_manim_len, to_pixel_len
-from smanim.utils.text_ops import wrap_text
-from PIL import ImageFont
+from smanim.utils.text_ops import text_layout_cache
 
 __all__ = ["Text"]
 
@@ -65,6 +64,7 @@ class Text(TransformableMobject):
         x_padding: float = 0,
         y_padding: float = 0,
         leading: float = 0.2,  # percent (as decimal) of line height for spacing between lines
+        as_paths: bool | None = None,  # use default in CONFIG: False, see `text_as_paths`
         **kwargs,
     ):
         if not isinstance(text, str):
@@ -79,6 +79,8 @@ class Text(TransformableMobject):
         self.text_decoration = text_decoration
         self.italics = italics
         self.bold = bold
+        # drawn from glyph outlines, with a bbox fit to the outlines instead of standard letters
+        self.as_paths = as_paths if as_paths is not None else CONFIG.text_as_paths
 
         self.fill_opacity = opacity
         # use defaults from CONFIG for global text styling
@@ -126,7 +128,6 @@ class Text(TransformableMobject):
         self.font_family = font_family
         self.font_size = font_size
         self.font_path = font_path
-        font = ImageFont.truetype(str(font_path), font_size)
         self.x_padding = x_padding
         self.y_padding = y_padding
         self.x_padding_in_pixels = to_pixel_len(x_padding, CONFIG.pw, CONFIG.fw)
@@ -134,15 +135,12 @@ class Text(TransformableMobject):
         max_width_in_pixels = to_pixel_len(max_width, CONFIG.pw, CONFIG.fw)
         self.leading = leading
 
-        # ascent, descent = font.getmetrics()
-        # self.font_ascent = ascent
-        # Note: Cannot use this since PIL captures maximum ascent possible, which is much more than standard letters
-        # Current code allows the bbox to be too small for those non-standard cases
-
-        _, t0, _, b0 = font.getbbox("aGg")
-        _, t, _, b = font.getbbox("aG")
-        self.font_ascent_pixels = b - t
-        self.font_descent_pixels = (b0 - t0) - (b - t)
+        # layouts are cached by text and font, since most text is repeated labels
+        layout = text_layout_cache.get_layout(
+            text, font_path, font_size, max_width_in_pixels, exact_bounds=self.as_paths
+        )
+        self.font_ascent_pixels = layout.ascent
+        self.font_descent_pixels = layout.descent
         leading_pixels = (self.font_ascent_pixels + self.font_descent_pixels) * leading
         self.leading_pixels = leading_pixels
 
@@ -151,12 +149,7 @@ class Text(TransformableMobject):
         )
         leading_in_munits = to_manim_len(leading_pixels, CONFIG.pw, CONFIG.fw)
 
-        text_tokens, dims = wrap_text(
-            text=text,
-            font_path=self.font_path,
-            font_size=font_size,
-            max_width_in_pixels=max_width_in_pixels,
-        )
+        text_tokens, dims = list(layout.text_tokens), layout.dims
         self.text_tokens = text_tokens
 
         self.font_widths = np.array(
@@ -1,10 +1,12 @@
 from __future__ import annotations
 import bisect
+from typing import Tuple
 from typing_extensions import Self
 
 import numpy as np
 
 from abc import ABC, abstractmethod
+from smanim.config import CONFIG
 from smanim.constants import (
     DEFAULT_STROKE_WIDTH,
     ORIGIN,
@@ -22,7 +24,7 @@ from smanim.typing import (
     QuadArray_Point3D,
     Vector3,
 )
-from smanim.utils.space_ops import mirror_vector
+from smanim.utils.space_ops import mirror_vector, rotation_matrix
 
 __all__ = ["VMobject", "VGroup"]
 
@@ -31,6 +33,10 @@ __all__ = ["VMobject", "VGroup"]
 class VMobject(TransformableMobject, ABC):
     """Base class for all objects represented by a path of bezier curves, with strokes or fills.
     `points` is a list of the points that form bezier curves.
+    With `CONFIG.lazy_transforms`, core transformations are composed into a pending affine map `(matrix, offset)`,
+    which is only applied to `points` when they (or the bounding points) are read.
+    Shapes built from the same parameters can share one read-only `points` buffer via `set_shared_points`.
+    Their transforms always stay pending, and reads return transformed copies, so the buffer is only copied when `points` is reset.
     """
 
     points_per_curve = 4
@@ -55,6 +61,9 @@ class VMobject(TransformableMobject, ABC):
     ):
         super().__init__(**kwargs)
         self.is_closed = is_closed
+        self._pending_transform: Tuple[np.ndarray, Vector3] | None = None
+        # whether `_points` is a canonical buffer shared with other instances
+        self._shares_points = False
         self.generate_points()
 
         # this VMobject base class chooses to set `fill_color` by default when `color` is set
@@ -106,6 +115,9 @@ class VMobject(TransformableMobject, ABC):
 
     @property
     def points(self):
+        if self._shares_points:
+            return self._get_transformed(self._points)
+        self._apply_pending_transform()
         return self._points
 
     @points.setter
@@ -117,6 +129,8 @@ class VMobject(TransformableMobject, ABC):
         # `points` are read-only but can be reset via this function
         new_points.flags.writeable = False
         self._points = new_points
+        self._pending_transform = None
+        self._shares_points = False
         # update the bounding box whenever points are moved
         bounding_points = self.get_start_anchors()
         if not self.is_closed and len(self._points) > 0:
@@ -125,12 +139,63 @@ class VMobject(TransformableMobject, ABC):
             )
         self.bounding_points = bounding_points
 
+    @property
+    def bounding_points(self):
+        if self._shares_points:
+            return self._get_transformed(self._bounding_points)
+        self._apply_pending_transform()
+        return self._bounding_points
+
+    @bounding_points.setter
+    def bounding_points(self, bounding_points: InternalPoint3D_Array):
+        TransformableMobject.bounding_points.fset(self, bounding_points)
+
+    def _add_pending_transform(self, matrix: np.ndarray, offset: Vector3) -> None:
+        """Composes the map `p => matrix @ p + offset` after any transform already pending"""
+        if len(self._points) == 0:
+            return
+        if self._pending_transform is None:
+            self._pending_transform = (matrix, offset)
+        else:
+            prev_matrix, prev_offset = self._pending_transform
+            self._pending_transform = (matrix @ prev_matrix, matrix @ prev_offset + offset)
+        self._invalidate_family_bounds()
+
+    def _apply_pending_transform(self) -> None:
+        if self._pending_transform is not None:
+            matrix, offset = self._pending_transform
+            self.points = self._points @ matrix.T + offset
+
+    def _get_transformed(self, points: InternalPoint3D_Array) -> InternalPoint3D_Array:
+        if self._pending_transform is None:
+            return points
+        matrix, offset = self._pending_transform
+        transformed = points @ matrix.T + offset
+        transformed.flags.writeable = False
+        return transformed
+
+    def _keeps_transforms_pending(self) -> bool:
+        return CONFIG.lazy_transforms or self._shares_points
+
+    def set_shared_points(
+        self,
+        points: InternalPoint3D_Array,
+        bounding_points: InternalPoint3D_Array | None = None,
+    ) -> None:
+        """Sets `points` to a read-only buffer that may be shared with other instances, e.g. from a cache of canonical shapes.
+        `bounding_points` can replace the bounding polygon derived from the anchors, until `points` are reset.
+        """
+        self.points = points
+        if bounding_points is not None:
+            self.bounding_points = bounding_points
+        self._shares_points = True
+
     ## Point ops
     def get_start_anchors(self) -> InternalPoint3D_Array:
-        return self._points[:: VMobject.points_per_curve]
+        return self.points[:: VMobject.points_per_curve]
 
     def get_end_anchors(self) -> InternalPoint3D_Array:
-        return self._points[VMobject.points_per_curve - 1 :: VMobject.points_per_curve]
+        return self.points[VMobject.points_per_curve - 1 :: VMobject.points_per_curve]
 
     def get_all_points(self) -> InternalPoint3D_Array:
         all_points = []
@@ -288,26 +353,49 @@ class VMobject(TransformableMobject, ABC):
         axis: Vector3 = OUT,
         about_point: Point3D | None = ORIGIN,
     ) -> Self:
-        self.points = super().rotate_points(self.points, angle, axis, about_point)
+        if self._keeps_transforms_pending():
+            # submobjects get the caller's `about_point`, so with None each rotates about its own center, like the eager path
+            pivot = about_point
+            if pivot is None:
+                pivot = self.get_critical_point(ORIGIN)
+            rot_matrix = rotation_matrix(angle, axis)
+            self._add_pending_transform(rot_matrix, pivot - rot_matrix @ pivot)
+        else:
+            self.points = super().rotate_points(self.points, angle, axis, about_point)
         for mob in self.submobjects:
             mob.rotate(angle, axis, about_point)
         return self
 
     # FUTURE: Consider scaling the stroke_width, if it exists.
     def scale(self, factor: float, about_point: Point3D | None = ORIGIN) -> Self:
-        self.points = super().scale_points(self.points, factor, about_point)
+        if self._keeps_transforms_pending():
+            # submobjects get the caller's `about_point`, see `rotate`
+            pivot = about_point if about_point is not None else self.center
+            self._add_pending_transform(
+                np.eye(3) * factor, np.asarray(pivot) * (1 - factor)
+            )
+        else:
+            self.points = super().scale_points(self.points, factor, about_point)
         for mob in self.submobjects:
             mob.scale(factor, about_point)
         return self
 
     def stretch(self, factor: float, dim: int) -> Self:
-        self.points = super().stretch_points(self.points, factor, dim)
+        if self._keeps_transforms_pending():
+            stretch_matrix = np.eye(3)
+            stretch_matrix[dim, dim] = factor
+            self._add_pending_transform(stretch_matrix, np.zeros(3))
+        else:
+            self.points = super().stretch_points(self.points, factor, dim)
         for mob in self.submobjects:
             mob.stretch(factor, dim)
         return self
 
     def shift(self, vector: Vector3) -> Self:
-        self.points = super().shift_points(self.points, vector)
+        if self._keeps_transforms_pending():
+            self._add_pending_transform(np.eye(3), np.asarray(vector, dtype=float))
+        else:
+            self.points = super().shift_points(self.points, vector)
         for mob in self.submobjects:
             mob.shift(vector)
         return self
@@ -0,0 +1,16 @@
+import sys
+
+__all__ = ["get_caller_lineno"]
+
+
+def get_caller_lineno(depth: int = 1) -> int | None:
+    """Returns the line being run `depth` frames above the function calling this one.
+    Reads the frame directly, unlike inspect.stack() which builds FrameInfo and loads source context for every frame on the stack.
+    """
+    try:
+        # +1 to skip this function's own frame
+        frame = sys._getframe(depth + 1)
+    except ValueError:
+        # stack is not that deep
+        return None
+    return frame.f_lineno
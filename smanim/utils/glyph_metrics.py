@@ -0,0 +1,205 @@
+import io
+from functools import lru_cache
+import logging
+from pathlib import Path
+from typing import List, Tuple
+
+import numpy as np
+from smanim.utils.import_ops import lazy_import
+
+svgPathPen = lazy_import("fontTools.pens.svgPathPen")
+ttLib = lazy_import("fontTools.ttLib")
+
+__all__ = ["GlyphMetrics", "get_glyph_metrics", "read_font_bytes"]
+
+# fontTools logs every table it reads, which happens lazily while measuring text
+logging.getLogger("fontTools.ttLib").setLevel(logging.WARNING)
+
+
+# Measures text from the font tables, instead of laying it out with a rasterizer like PIL
+# All values are in font units until scaled by `font_size / units_per_em`
+class GlyphMetrics:
+    """Advance widths, pair kerning and vertical glyph bounds of one font face, read lazily with fontTools"""
+
+    def __init__(self, font_data: bytes):
+        self._font = ttLib.TTFont(io.BytesIO(font_data), lazy=True)
+        self.units_per_em: int = self._font["head"].unitsPerEm
+        self._cmap: dict[int, str] = self._font.getBestCmap()
+        self._advances: dict[str, int] = {
+            glyph: advance
+            for glyph, (advance, _) in self._font["hmtx"].metrics.items()
+        }
+        # glyph => (y_min, y_max), or None for glyphs without outlines like spaces
+        self._vertical_bounds: dict[str, Tuple[int, int] | None] = {}
+        # each lookup is a list of PairPos subtables, only the first subtable with a value for a pair applies
+        self._kerning_lookups: List[List[PairKerning]] = self._read_kerning_lookups()
+        self._kerning: dict[Tuple[str, str], int] = {}
+        # glyph => svg path data of its outline, in font units with y pointing up
+        self._glyph_paths: dict[str, str] = {}
+
+    def get_glyph(self, char: str) -> str:
+        return self._cmap.get(ord(char), ".notdef")
+
+    def get_advances(self, text: str) -> Tuple[np.ndarray, np.ndarray]:
+        """Returns how far the pen moves for each char, and the kerning between each char and the one before it"""
+        glyphs = [self.get_glyph(char) for char in text]
+        advances = np.array(
+            [self._advances.get(glyph, 0) for glyph in glyphs], dtype=float
+        )
+        kerning = np.zeros(len(glyphs))
+        if self._kerning_lookups:
+            for i in range(1, len(glyphs)):
+                kerning[i] = self.get_kerning(glyphs[i - 1], glyphs[i])
+        return advances, kerning
+
+    def get_width(self, text: str, font_size: float) -> float:
+        """Returns the advance width of `text` in pixels"""
+        advances, kerning = self.get_advances(text)
+        return float(np.sum(advances) + np.sum(kerning)) * font_size / self.units_per_em
+
+    def get_pen_positions(self, text: str) -> np.ndarray:
+        """Returns the x of each char's origin, relative to the start of `text`"""
+        advances, kerning = self.get_advances(text)
+        return np.concatenate([[0.0], np.cumsum(advances)[:-1]]) + np.cumsum(kerning)
+
+    def get_ink_height(self, text: str, font_size: float) -> float:
+        """Returns the height in pixels from the lowest to the highest outline point of `text`"""
+        extent = self.get_vertical_extent(text)
+        if extent is None:
+            return 0.0
+        y_min, y_max = extent
+        return (y_max - y_min) * font_size / self.units_per_em
+
+    def get_vertical_extent(self, text: str) -> Tuple[int, int] | None:
+        """Returns the (y_min, y_max) of the outlines of `text`, or None if no char has an outline"""
+        bounds = [self._get_vertical_bounds(self.get_glyph(char)) for char in text]
+        bounds = [b for b in bounds if b is not None]
+        if len(bounds) == 0:
+            return None
+        return min(b[0] for b in bounds), max(b[1] for b in bounds)
+
+    def get_glyph_path(self, glyph: str) -> str:
+        """Returns the svg path data of the glyph's outline, empty for glyphs without one like spaces"""
+        if glyph not in self._glyph_paths:
+            glyph_set = self._font.getGlyphSet()
+            pen = svgPathPen.SVGPathPen(glyph_set)
+            glyph_set[glyph].draw(pen)
+            self._glyph_paths[glyph] = pen.getCommands()
+        return self._glyph_paths[glyph]
+
+    def get_decoration(self, text_decoration: str) -> Tuple[float, float] | None:
+        """Returns the (y, thickness) of the line drawn for a css `text-decoration`, or None for "none"."""
+        if text_decoration == "underline":
+            post = self._font["post"]
+            return post.underlinePosition, post.underlineThickness
+        if text_decoration == "line-through":
+            os2 = self._font["OS/2"]
+            return os2.yStrikeoutPosition, os2.yStrikeoutSize
+        if text_decoration == "overline":
+            post = self._font["post"]
+            return self._font["hhea"].ascent, post.underlineThickness
+        return None
+
+    def get_kerning(self, left: str, right: str) -> int:
+        key = (left, right)
+        if key not in self._kerning:
+            self._kerning[key] = sum(
+                self._get_lookup_kerning(lookup, left, right)
+                for lookup in self._kerning_lookups
+            )
+        return self._kerning[key]
+
+    def _get_vertical_bounds(self, glyph: str) -> Tuple[int, int] | None:
+        if glyph not in self._vertical_bounds:
+            bounds = None
+            if "glyf" in self._font:
+                outline = self._font["glyf"][glyph]
+                if outline.numberOfContours != 0:
+                    bounds = (outline.yMin, outline.yMax)
+            self._vertical_bounds[glyph] = bounds
+        return self._vertical_bounds[glyph]
+
+    def _read_kerning_lookups(self) -> List[List["PairKerning"]]:
+        if "GPOS" not in self._font:
+            return []
+        gpos = self._font["GPOS"].table
+        if gpos.FeatureList is None or gpos.LookupList is None:
+            return []
+        lookup_indices = sorted(
+            {
+                index
+                for record in gpos.FeatureList.FeatureRecord
+                if record.FeatureTag == "kern"
+                for index in record.Feature.LookupListIndex
+            }
+        )
+        lookups = []
+        for index in lookup_indices:
+            lookup = gpos.LookupList.Lookup[index]
+            subtables = []
+            for subtable in lookup.SubTable:
+                # extension lookups wrap the actual subtable
+                if lookup.LookupType == 9:
+                    if subtable.ExtensionLookupType != 2:
+                        continue
+                    subtable = subtable.ExtSubTable
+                elif lookup.LookupType != 2:
+                    continue
+                subtables.append(PairKerning(subtable))
+            if subtables:
+                lookups.append(subtables)
+        return lookups
+
+    @staticmethod
+    def _get_lookup_kerning(
+        subtables: List["PairKerning"], left: str, right: str
+    ) -> int:
+        for subtable in subtables:
+            value = subtable.get(left, right)
+            if value is not None:
+                return value
+        return 0
+
+
+class PairKerning:
+    """Index over a GPOS PairPos subtable, so pairs are found without scanning its glyph lists"""
+
+    def __init__(self, subtable):
+        self.subtable = subtable
+        self.coverage = {glyph: i for i, glyph in enumerate(subtable.Coverage.glyphs)}
+        # first glyph => second glyph => x advance adjustment, filled as first glyphs are used
+        self.pairs: dict[str, dict[str, int]] = {}
+
+    def get(self, left: str, right: str) -> int | None:
+        """Returns the kerning of the pair, or None if this subtable does not apply to it"""
+        index = self.coverage.get(left)
+        if index is None:
+            return None
+        if self.subtable.Format == 1:
+            if left not in self.pairs:
+                self.pairs[left] = {
+                    record.SecondGlyph: get_x_advance(record.Value1)
+                    for record in self.subtable.PairSet[index].PairValueRecord
+                }
+            return self.pairs[left].get(right)
+        class1 = self.subtable.ClassDef1.classDefs.get(left, 0)
+        class2 = self.subtable.ClassDef2.classDefs.get(right, 0)
+        record = self.subtable.Class1Record[class1].Class2Record[class2]
+        return get_x_advance(record.Value1)
+
+
+def get_x_advance(value_record) -> int:
+    return getattr(value_record, "XAdvance", 0) or 0
+
+
+@lru_cache(maxsize=None)
+def read_font_bytes(font_path: str) -> bytes:
+    """Returns the contents of the font file, read once per process"""
+    with open(font_path, "rb") as font_file:
+        return font_file.read()
+
+
+@lru_cache(maxsize=32)
+def get_glyph_metrics(font_path: Path | str) -> GlyphMetrics:
+    """Returns the metrics of a font face, loaded once per process"""
+    return GlyphMetrics(read_font_bytes(str(font_path)))
@@ -0,0 +1,32 @@
+import importlib
+import importlib.util
+import sys
+from types import ModuleType
+
+__all__ = ["lazy_import"]
+
+
+class LazyModule(ModuleType):
+    """Stands in for the module `name` until one of its attributes is first used, then imports it normally.
+    Unlike `importlib.util.LazyLoader`, nothing is put in `sys.modules` early, so user code importing the module
+    or its submodules gets a regular import, with submodules bound on their packages.
+    """
+
+    def __getattr__(self, attr: str):
+        # only called for attributes missing from this module, so after the first use lookups skip this
+        module = importlib.import_module(self.__name__)
+        self.__dict__.update(module.__dict__)
+        return getattr(module, attr)
+
+
+def lazy_import(name: str) -> ModuleType:
+    """Returns the module `name`, only running it once one of its attributes is first used.
+    Heavy dependencies are imported this way so `import smanim` stays fast, which matters most in pyodide,
+    e.g. svgelements is only loaded once an svg path is parsed.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    # only the top-level package is looked up, since finding a submodule runs its packages
+    if importlib.util.find_spec(name.partition(".")[0]) is None:
+        raise ModuleNotFoundError(f"No module named {name!r}", name=name)
+    return LazyModule(name)
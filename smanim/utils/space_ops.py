@@ -26,6 +26,31 @@ def to_manim_len(scalar: float, pw: float, fw: float):
     return scalar * (fw / pw)
 
 
+def read_only(array: np.ndarray) -> np.ndarray:
+    """Returns a read-only view of `array` that cannot be made writeable again, for arrays shared through a cache.
+    Views are copied first, since numpy only refuses to make a view writeable when the array owning its data is read-only.
+    """
+    if array.base is not None:
+        array = array.copy()
+    array.flags.writeable = False
+    view = array.view()
+    view.flags.writeable = False
+    return view
+
+
+def get_pixel_transform(
+    pw: float, ph: float, fw: float, fh: float, fc: Vector3
+) -> np.ndarray:
+    """Returns the (2 x 3) affine matrix that maps homogeneous manim coords [x, y, 1] to pixel coords"""
+    # instead of using a matrix within cairo or canvas
+    return np.array(
+        [
+            [pw / fw, 0, (pw / 2) - fc[0] * (pw / fw)],
+            [0, -(ph / fh), (ph / 2) + fc[1] * (ph / fh)],
+        ]
+    )
+
+
 def to_pixel_coords(
     points: Point3D_Array,
     pw: float | None = None,
@@ -36,26 +61,19 @@ def to_pixel_coords(
     config: Config | None = None,
     decimal_precision: int | None = None,
 ) -> InternalPoint3D_Array:
-    if config is not None:
-        pw, ph, fw, fh, fc = config.pw, config.ph, config.fw, config.fh, config.fc
     if len(points) == 0:
         return []
+    if config is not None:
+        coord_mat = config.pixel_transform
+    else:
+        coord_mat = get_pixel_transform(pw, ph, fw, fh, fc)
+    points = np.asarray(points, dtype=ManimFloat)
     if not np.all(np.isfinite(points)):
         log.warn("At least point is not finite. Using default (0, 0, 0).")
         points = np.zeros((1, 3))
-    points = np.array(points.copy(), dtype=ManimFloat)
     # assume points are 2D so last dimesion z is unused in [x, y, z]
-    points[:, -1] = 1
-    # instead of using a matrix within cairo or canvas
-
-    coord_mat = np.array(
-        [
-            [pw / fw, 0, (pw / 2) - fc[0] * (pw / fw)],
-            [0, -(ph / fh), (ph / 2) + fc[1] * (ph / fh)],
-        ]
-    )
-    # (N x 3) @ (3 x 2) = (N x 2)
-    points = points @ coord_mat.T
+    # (N x 2) @ (2 x 2) + translation = (N x 2)
+    points = points[:, :2] @ coord_mat[:, :2].T + coord_mat[:, 2]
 
     if decimal_precision is not None:
         points = np.around(points, decimals=decimal_precision)
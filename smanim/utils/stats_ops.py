@@ -0,0 +1,76 @@
+from collections import Counter
+from pathlib import Path
+from typing import Iterable
+
+import numpy as np
+
+from smanim.mobject.mobject import Mobject
+from smanim.mobject.text.text_mobject import Text
+from smanim.mobject.vmobject import VGroup, VMobject
+
+__all__ = ["get_stats"]
+
+
+def get_stats(mobjects: Iterable[Mobject]) -> dict:
+    """Returns the complexity of `mobjects`, walking them once. Submobjects must be included, see `Mobject.get_family`.
+    - counts: number of mobjects per class
+    - bezier_points: number of points in all vmobjects, which have 4 per curve
+    - array_bytes: bytes of the `points` and `bounding_points` arrays, counting buffers shared by several mobjects once
+    - access_paths: number of `AccessPath` entries, which grow with the bidirectional metadata
+    - texts and fonts: number of text mobjects and the distinct font files they use
+    - svg_elements: estimated number of elements in the svg, see `Canvas.get_to_svg_func`
+    """
+    counts = Counter()
+    bezier_points = 0
+    # id of each buffer => its bytes, so shared and viewed arrays are counted once
+    buffers: dict[int, int] = {}
+    access_paths = 0
+    texts = 0
+    fonts = set()
+    svg_elements = 0
+    for mobject in mobjects:
+        counts[type(mobject).__qualname__] += 1
+        access_paths += len(mobject.access_paths)
+        # read the stored arrays, since the properties can copy them to apply pending transforms
+        arrays = [mobject._bounding_points]
+        if isinstance(mobject, VMobject):
+            arrays.append(mobject._points)
+            bezier_points += len(mobject._points)
+
+        if isinstance(mobject, Text):
+            texts += 1
+            fonts.add(Path(mobject.font_path).name)
+            svg_elements += get_text_svg_element_count(mobject)
+        elif isinstance(mobject, VMobject) and not isinstance(mobject, VGroup):
+            # a <path>, or a <use> of a shared one
+            svg_elements += 1 if len(mobject._points) > 0 else 0
+        else:
+            # groups and other mobjects are drawn as a transparent rect for selection
+            svg_elements += 1
+        for array in arrays:
+            if not isinstance(array, np.ndarray):
+                continue
+            buffer = array.base if isinstance(array.base, np.ndarray) else array
+            buffers[id(buffer)] = buffer.nbytes
+    return {
+        "mobjects": sum(counts.values()),
+        "counts": dict(counts.most_common()),
+        "bezier_points": bezier_points,
+        "array_bytes": sum(buffers.values()),
+        "access_paths": access_paths,
+        "texts": texts,
+        "fonts": sorted(fonts),
+        "svg_elements": svg_elements,
+    }
+
+
+def get_text_svg_element_count(text: Text) -> int:
+    """Returns the number of svg elements `text` is drawn with, see `Canvas.text_to_svg_el`"""
+    if not text.as_paths:
+        # a <text> with a <tspan> per line
+        return 1 + len(text.text_tokens)
+    # a group with a group per line, holding a <use> per drawn glyph
+    num_lines = len(text.text_tokens)
+    num_glyphs = sum(len("".join(token.split())) for token in text.text_tokens)
+    num_decorations = num_lines if text.text_decoration != "none" else 0
+    return 1 + num_lines + num_glyphs + num_decorations
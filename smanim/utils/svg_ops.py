@@ -0,0 +1,20 @@
+import numpy as np
+
+from smanim.typing import InternalPoint3D_Array
+
+
+def to_svg_path_data(points: InternalPoint3D_Array, is_closed: bool = False) -> str:
+    """Encodes bezier `points` (4 per curve, in pixel coords) as the `d` attribute of an svg path.
+    Assumes a continuous path with no subpaths, so the start anchor of every curve after the first is skipped.
+    Numbers are formatted the same way svg.py formats them, but in a single pass rather than per curve.
+    """
+    points = np.asarray(points)[:, :2]
+    num_curves = len(points) // 4
+    if num_curves == 0:
+        return ""
+    # (num_curves, 4, 2) => drop each start anchor => (num_curves, 6)
+    curves = points.reshape(num_curves, 4, 2)[:, 1:].reshape(num_curves, 6)
+    template = "M {} {}" + " C {} {} {} {} {} {}" * num_curves
+    if is_closed:
+        template += " Z"
+    return template.format(*points[0].tolist(), *curves.ravel().tolist())
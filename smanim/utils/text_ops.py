@@ -1,17 +1,57 @@
+import atexit
+import base64
+from collections import OrderedDict
+from functools import lru_cache
+import hashlib
+import io
+import json
+import logging
 from pathlib import Path
-from typing import List, Tuple
-from PIL import ImageFont
+from typing import Iterable, List, NamedTuple, Tuple
+import numpy as np
+from smanim.utils.glyph_metrics import get_glyph_metrics, read_font_bytes
+from smanim.utils.import_ops import lazy_import
+from smanim.utils.logger import log
+
+subset = lazy_import("fontTools.subset")
+ttLib = lazy_import("fontTools.ttLib")
+
+# fontTools warns about every table it drops while subsetting
+logging.getLogger("fontTools.subset").setLevel(logging.ERROR)
 
 # in browser, can use foreign objects
 # https://stackoverflow.com/questions/4991171/auto-line-wrapping-in-svg-text
 # FUTURE: This will probably be its own text class, WText() "Web Text"
 # locally, must implement text wrap manually, like I did below
+# text is measured from the font tables (see glyph_metrics.py), so PIL is not needed
 # https://stackoverflow.com/questions/26276125/how-to-manipulate-svg-foreign-object-html-text-wrapping-and-positioning
 
 
-# FUTURE: Consider using fonttools to get raw glyph width and height
-# https://gist.github.com/nitely/62b281dcfd15490e1ed21296d6be3113
-# Actually this takes a lot more time, up to 0.18 seconds vs 0.05 seconds. The time is from loading the font. Unless if I load the font ahead of time, this won't work.
+@lru_cache(maxsize=32)
+def get_font_metrics(font_path: Path | str, font_size: float) -> Tuple[float, float]:
+    """Returns the (ascent, descent) in pixels of standard letters, measured from the outlines of "aG" and "aGg"."""
+    # the font's own ascent is not used since it covers the tallest glyphs, which is much more than standard letters
+    # Current code allows the bbox to be too small for those non-standard cases
+    metrics = get_glyph_metrics(font_path)
+    ascent = metrics.get_ink_height("aG", font_size)
+    return ascent, metrics.get_ink_height("aGg", font_size) - ascent
+
+
+def get_ink_metrics(
+    font_path: Path | str, font_size: float, text: str
+) -> Tuple[float, float]:
+    """Returns the (ascent, descent) in pixels of the outlines of `text` itself, for exact bounding boxes.
+    Falls back to `get_font_metrics` for text without outlines, like spaces.
+    """
+    metrics = get_glyph_metrics(font_path)
+    extent = metrics.get_vertical_extent(text)
+    if extent is None:
+        return get_font_metrics(font_path, font_size)
+    y_min, y_max = extent
+    scale = font_size / metrics.units_per_em
+    return y_max * scale, -y_min * scale
+
+
 def wrap_text(
     text: str,
     font_path: Path,
@@ -20,79 +60,221 @@ def wrap_text(
 ) -> Tuple[List[str], List[Tuple[float, float]]]:
     """
     Returns a list where each element is the contents of a new line and a corresponding list containing (width, height) dimensions per line
+    Widths are advance widths from the font tables. Each line takes the most words that fit, found by binary search.
     """
-    # this entire function takes 0.006 seconds on 22 words, 4 lines wrapping
+    metrics = get_glyph_metrics(font_path)
+    scale = font_size / metrics.units_per_em
+    advances, kerning = metrics.get_advances(text)
+    # prefix sums, so the width of any span of chars is a subtraction
+    advance_sums = np.concatenate([[0.0], np.cumsum(advances)]) * scale
+    kerning_sums = np.concatenate([[0.0], np.cumsum(kerning)]) * scale
+    # repeated at the end, so spans starting at the end of `text` can read `start + 1`
+    kerning_sums = np.append(kerning_sums, kerning_sums[-1])
+
+    def get_widths(start: int, ends: np.ndarray) -> np.ndarray:
+        # widths of chars [start, end), without the kerning with the char before `start`
+        # an empty span has no kerning, so `ends` are clamped to `start + 1`
+        return (advance_sums[ends] - advance_sums[start]) + (
+            kerning_sums[np.maximum(ends, start + 1)] - kerning_sums[start + 1]
+        )
+
+    def get_dim_lens(start: int, end: int) -> Tuple[float, float]:
+        width = float(get_widths(start, np.array([end]))[0])
+        return width, metrics.get_ink_height(text[start:end], font_size)
+
     words = text.split(" ")
+    # [start, end) index in `text` of each word
+    word_starts = np.cumsum([0] + [len(word) + 1 for word in words[:-1]])
+    word_ends = word_starts + np.array([len(word) for word in words])
+
     text_tokens = []
     dims = []  # tracks dimensions of each text token
-    font = ImageFont.truetype(str(font_path), font_size)
-    x_size = font.getlength("x")
-    approx_num_chars_per_line = int(max_width_in_pixels / x_size)
-    if approx_num_chars_per_line == 0:
-        approx_num_chars_per_line += 1
-        # raise ValueError("Approx num chars must be > 0")
-
-    def get_dim_lens(text):
-        # Getting the bbox takes ~0.0006 seconds locally (166 ops per 0.1 seconds)
-        # Note: "aG" has different height than "aa"
-        left, top, right, bottom = font.getbbox(text)
-        width = right - left
-        height = bottom - top
-
-        # TODO: Fix bug. Why is width not working for getbbox or getlength
-        # width = font.getlength(text)
-        return width, height
-
-    to_process = text
     word_ind = 0
-
     while word_ind < len(words):
-        remaining_words = words[word_ind:]
-        to_process = " ".join(remaining_words)
-        width, height = get_dim_lens(to_process)
-        if len(remaining_words) == 1 or width < max_width_in_pixels:
-            text_tokens.append(to_process)
-            dims.append((width, height))
-            break
-        cur_ind = word_ind  # index in `words` of end of `cur_text`, exclusive
-        cur_text, *remaining_words = remaining_words
-        for word in remaining_words:
-            if len(cur_text + word) <= approx_num_chars_per_line:
-                cur_text += " " + word
-                cur_ind += 1
-            else:
-                break
-        width, height = get_dim_lens(cur_text)
-        if width < max_width_in_pixels:
-            while width < max_width_in_pixels:
-                cur_ind += 1
-                if cur_ind > len(words):
-                    break
-                cur_text = " ".join(words[word_ind:cur_ind])
-                width, height = get_dim_lens(cur_text)
-
-            cur_ind -= 1
-            one_back = " ".join(words[word_ind:cur_ind])
-            # add extra space for copying and pasting smoothness, if not the last word
-            if cur_ind != len(words):
-                one_back += " "
-            width, height = get_dim_lens(one_back)
-            text_tokens.append(one_back)
-            dims.append((width, height))
-            word_ind = cur_ind
+        start = word_starts[word_ind]
+        # widths only grow as words are added, except for rare negative kerning
+        line_widths = np.maximum.accumulate(get_widths(start, word_ends[word_ind:]))
+        num_words = int(np.searchsorted(line_widths, max_width_in_pixels, side="left"))
+        # choosing to show the whole word and not wrap it, if it's too big for it's own line
+        end_ind = word_ind + max(num_words, 1)
+        if end_ind == len(words):
+            end = len(text)
         else:
-            while width > max_width_in_pixels:
-                cur_ind -= 1
-                # add extra space for copying and pasting smoothness, guaranteed not the last word
-                cur_text = " ".join(words[word_ind:cur_ind]) + " "
-                width, height = get_dim_lens(cur_text)
-                if cur_ind == word_ind:
-                    # choosing to show the whole word and not wrap it, if it's too big for it's own line
-                    cur_ind = word_ind + 1
-                    break
-
-            text_tokens.append(cur_text)
-            width, height = get_dim_lens(cur_text)
-            dims.append((width, height))
-            word_ind = cur_ind
+            # add extra space for copying and pasting smoothness, if not the last word
+            end = word_ends[end_ind - 1] + 1
+        text_tokens.append(text[start:end])
+        dims.append(get_dim_lens(start, end))
+        word_ind = end_ind
     return text_tokens, dims
+
+
+class TextLayout(NamedTuple):
+    text_tokens: Tuple[str, ...]
+    dims: Tuple[Tuple[float, float], ...]  # (width, height) in pixels per token
+    ascent: float  # in pixels, see `get_font_metrics`
+    descent: float
+
+
+@lru_cache(maxsize=None)
+def _get_font_digest(font_path: str) -> str:
+    return hashlib.md5(read_font_bytes(font_path)).hexdigest()
+
+
+# saved with the persisted layouts, and bumped whenever layouts change, e.g. how text is measured
+# files saved by other versions are ignored, since their layouts would be stale
+TEXT_LAYOUT_CACHE_VERSION = 1
+
+
+class TextLayoutCache:
+    """LRU cache of text layouts, since the same labels (tick numbers, vertex names, weights) are laid out over and over.
+    Padding and leading are applied after the layout, so they are not part of the key.
+    With `set_path`, layouts are also persisted to a json file so later runs can skip layout entirely.
+    """
+
+    def __init__(self, maxsize: int = 4096):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._layouts: OrderedDict[Tuple, TextLayout] = OrderedDict()
+        self.path: Path | None = None
+        # json key => layout, loaded from `path`
+        self._persisted: dict[str, list] = {}
+        self._dirty = False
+
+    def get_layout(
+        self,
+        text: str,
+        font_path: Path | str,
+        font_size: float,
+        max_width_in_pixels: float,
+        exact_bounds: bool = False,
+    ) -> TextLayout:
+        """Returns the layout of `text`. With `exact_bounds`, the ascent and descent are of this text's outlines, instead of standard letters."""
+        key = (text, str(font_path), font_size, max_width_in_pixels, exact_bounds)
+        layout = self._layouts.get(key)
+        if layout is not None:
+            self.hits += 1
+            self._layouts.move_to_end(key)
+            return layout
+
+        persisted_key = None
+        if self.path is not None:
+            persisted_key = json.dumps(
+                [
+                    text,
+                    _get_font_digest(str(font_path)),
+                    font_size,
+                    max_width_in_pixels,
+                    exact_bounds,
+                ]
+            )
+            persisted = self._persisted.get(persisted_key)
+            if persisted is not None:
+                try:
+                    tokens, dims, ascent, descent = persisted
+                    layout = TextLayout(
+                        tuple(tokens),
+                        tuple((float(width), float(height)) for width, height in dims),
+                        float(ascent),
+                        float(descent),
+                    )
+                    self.hits += 1
+                except (TypeError, ValueError):
+                    # a malformed entry is laid out again and replaced
+                    layout = None
+        if layout is None:
+            self.misses += 1
+            text_tokens, dims = wrap_text(
+                text, font_path, font_size, max_width_in_pixels
+            )
+            if exact_bounds:
+                ascent, descent = get_ink_metrics(font_path, font_size, text)
+            else:
+                ascent, descent = get_font_metrics(font_path, font_size)
+            layout = TextLayout(tuple(text_tokens), tuple(dims), ascent, descent)
+            if persisted_key is not None:
+                self._persisted[persisted_key] = list(layout)
+                self._dirty = True
+
+        self._layouts[key] = layout
+        if len(self._layouts) > self.maxsize:
+            self._layouts.popitem(last=False)
+        return layout
+
+    def cache_info(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._layouts),
+            "maxsize": self.maxsize,
+            "persisted": len(self._persisted),
+        }
+
+    def clear(self) -> None:
+        """Clears the in-memory layouts and counters. The json file, if any, is kept."""
+        self._layouts.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def set_path(self, path: Path | str | None) -> None:
+        """Persists layouts to the json file at `path`, loading any saved by earlier runs. They are saved at exit, or with `save`."""
+        self.save()
+        self.path = Path(path) if path is not None else None
+        self._persisted = {}
+        self._dirty = False
+        if self.path is not None and self.path.exists():
+            self._persisted = self._load(self.path)
+
+    def _load(self, path: Path) -> dict[str, list]:
+        try:
+            with open(path) as f:
+                saved = json.load(f)
+        except (OSError, ValueError) as e:
+            log.warning(f"Ignoring unreadable text layout cache {path}: {e}")
+            return {}
+        if (
+            not isinstance(saved, dict)
+            or saved.get("version") != TEXT_LAYOUT_CACHE_VERSION
+            or not isinstance(saved.get("layouts"), dict)
+        ):
+            return {}
+        return saved["layouts"]
+
+    def save(self) -> None:
+        if self.path is None or not self._dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "w") as f:
+            json.dump(
+                {"version": TEXT_LAYOUT_CACHE_VERSION, "layouts": self._persisted}, f
+            )
+        self._dirty = False
+
+
+text_layout_cache = TextLayoutCache()
+atexit.register(text_layout_cache.save)
+
+
+@lru_cache(maxsize=128)
+def _encode_font(font_path: str, chars: str | None) -> str:
+    font_data = read_font_bytes(font_path)
+    if chars is not None:
+        # keep the original timestamp so output is reproducible
+        font = ttLib.TTFont(io.BytesIO(font_data), recalcTimestamp=False)
+        subsetter = subset.Subsetter(subset.Options())
+        subsetter.populate(text=chars)
+        subsetter.subset(font)
+        buffer = io.BytesIO()
+        font.save(buffer)
+        font_data = buffer.getvalue()
+    return base64.b64encode(font_data).decode("utf-8")
+
+
+def get_base64_font(font_path: Path | str, chars: Iterable[str] | None = None) -> str:
+    """Returns the base64 encoded font file, for embedding in an svg.
+    If `chars` is given, the font is first subset to only the glyphs needed for those characters.
+    Results are cached for the lifetime of the process.
+    """
+    if chars is not None:
+        chars = "".join(sorted(set(chars)))
+    return _encode_font(str(font_path), chars)
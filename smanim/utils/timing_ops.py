@@ -0,0 +1,52 @@
+from time import perf_counter
+
+__all__ = ["PhaseTimer"]
+
+
+class PhaseTimer:
+    """Sums the time spent in each named phase, e.g. the phases of `canvas.snapshot()`.
+    When disabled, `span` returns a shared no-op context, so timed code costs about a function call.
+    """
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        # phase => seconds, in the order the phases first ran
+        self.timings: dict[str, float] = {}
+
+    def span(self, phase: str):
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, phase)
+
+    def add(self, phase: str, seconds: float) -> None:
+        if self.enabled:
+            self.timings[phase] = self.timings.get(phase, 0.0) + seconds
+
+
+class _Span:
+    __slots__ = ("timer", "phase", "start")
+
+    def __init__(self, timer: PhaseTimer, phase: str):
+        self.timer = timer
+        self.phase = phase
+
+    def __enter__(self):
+        self.start = perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.timer.add(self.phase, perf_counter() - self.start)
+        return False
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
@@ -0,0 +1,180 @@
+import linecache
+import sys
+
+from smanim import *
+from smanim.bidirectional import bidirectional
+from smanim.bidirectional.bidirectional import (
+    MAX_CACHED_BY_HASH,
+    build_assignment_index,
+    get_assignment_index,
+    instrument_assignments,
+    run_with_assignment_capture,
+    trace_assignments,
+)
+from smanim.mobject.mobject import AccessType
+
+SCRIPT_FILENAME = "<bidirectional-test-script>"
+
+# a custom mobject assigns its own parts while it is being assigned, and some assignments span several lines
+SCRIPT = """
+class Labeled(Group):
+    def __init__(self, side_length):
+        box = Square(side_length=side_length)
+        dot = Dot(
+            box.center,
+        )
+        super().__init__(box, dot)
+
+
+square = Square()
+circle = Circle(
+    radius=2,
+).shift(RIGHT)
+labeled = Labeled(
+    1.5,
+)
+group = Group(square, circle)
+group.add(labeled)
+"""
+
+
+def get_access_paths(script_globals: dict) -> list:
+    """Returns the access paths of every assigned mobject and its submobjects, in a comparable form"""
+    paths = []
+    for name, value in script_globals.items():
+        if not isinstance(value, Mobject):
+            continue
+        for mob in value.get_family():
+            paths.append(
+                (
+                    name,
+                    type(mob).__name__,
+                    [
+                        (path.type, path.subpath, path.lineno, path.mob_id is None)
+                        for path in mob.access_paths
+                    ],
+                )
+            )
+    return paths
+
+
+def cache_source(filename: str, source: str) -> None:
+    # the tracer reads the source of traced frames through linecache
+    linecache.cache[filename] = (
+        len(source),
+        None,
+        source.splitlines(keepends=True),
+        filename,
+    )
+
+
+def run_with_settrace(source: str) -> dict:
+    script_globals = {"__name__": "__main__"}
+    exec("from smanim import *", script_globals)
+    cache_source(SCRIPT_FILENAME, source)
+    code = compile(source, SCRIPT_FILENAME, "exec")
+    reset_bidirectional()
+    sys.settrace(trace_assignments)
+    try:
+        exec(code, script_globals)
+    finally:
+        sys.settrace(None)
+    return script_globals
+
+
+def run_instrumented(source: str) -> dict:
+    script_globals = {"__name__": "__main__"}
+    exec("from smanim import *", script_globals)
+    reset_bidirectional()
+    return run_with_assignment_capture(source, SCRIPT_FILENAME, script_globals)
+
+
+def test_instrument_and_settrace_capture_the_same_access_paths():
+    traced = get_access_paths(run_with_settrace(SCRIPT))
+    instrumented = get_access_paths(run_instrumented(SCRIPT))
+    assert traced == instrumented
+    # the multi-line assignments and the parts of the custom mobject are captured
+    captured = {
+        (path[1], path[2])
+        for _, _, mob_paths in traced
+        for path in mob_paths
+        if path[0] == AccessType.TOP_LEVEL_ASSIGN
+    }
+    assert {("circle", 12), ("labeled", 15), ("box", 4), ("dot", 5)} <= captured
+
+
+def test_instrumented_code_is_reused_for_unchanged_source():
+    code = instrument_assignments(SCRIPT, SCRIPT_FILENAME)
+    assert instrument_assignments(SCRIPT, SCRIPT_FILENAME) is code
+    edited = SCRIPT.replace("radius=2", "radius=3")
+    assert instrument_assignments(edited, SCRIPT_FILENAME) is not code
+
+
+def record_index_builds() -> list:
+    """Records the files whose assignment index is built, instead of found in the cache. Undo with `stop_recording_index_builds`."""
+    builds = []
+
+    def recording_build(content, file="<unknown>"):
+        builds.append(file)
+        return build_assignment_index(content, file)
+
+    bidirectional.build_assignment_index = recording_build
+    return builds
+
+
+def stop_recording_index_builds() -> None:
+    bidirectional.build_assignment_index = build_assignment_index
+
+
+def test_assignment_index_is_reused_until_the_file_changes():
+    builds = record_index_builds()
+    try:
+        filename = "<assignment-index-test>"
+        cache_source(filename, SCRIPT)
+        index = get_assignment_index(filename)
+        assert index[12] == ("circle", 14)
+        assert get_assignment_index(filename) is index
+
+        # the editor resets before every run, and the unchanged file is not parsed again
+        reset_bidirectional()
+        cache_source(filename, SCRIPT)
+        assert get_assignment_index(filename) is index
+        assert builds == [filename]
+
+        edited = "extra = Square()\n" + SCRIPT
+        cache_source(filename, edited)
+        edited_index = get_assignment_index(filename)
+        assert edited_index[1] == ("extra", 1)
+        assert edited_index[13] == ("circle", 15)
+        assert builds == [filename, filename]
+    finally:
+        stop_recording_index_builds()
+
+
+def test_assignment_indexes_by_hash_is_bounded():
+    builds = record_index_builds()
+    try:
+        filename = "<assignment-index-bound-test>"
+        versions = [f"x{i} = {i}\n" for i in range(MAX_CACHED_BY_HASH + 5)]
+        for version in versions:
+            cache_source(filename, version)
+            get_assignment_index(filename)
+        assert len(bidirectional.assignment_indexes_by_hash) <= MAX_CACHED_BY_HASH
+
+        # the most recent versions are kept, the oldest were evicted
+        num_builds = len(builds)
+        cache_source(filename, versions[-2])
+        get_assignment_index(filename)
+        assert len(builds) == num_builds
+        cache_source(filename, versions[0])
+        get_assignment_index(filename)
+        assert len(builds) == num_builds + 1
+    finally:
+        stop_recording_index_builds()
+
+
+if __name__ == "__main__":
+    test_instrument_and_settrace_capture_the_same_access_paths()
+    test_instrumented_code_is_reused_for_unchanged_source()
+    test_assignment_index_is_reused_until_the_file_changes()
+    test_assignment_indexes_by_hash_is_bounded()
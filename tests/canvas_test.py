@@ -0,0 +1,340 @@
+import io
+import json
+import re
+import tempfile
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from time import perf_counter
+
+import numpy as np
+from smanim import *
+from smanim.mobject.mobject import AccessPath, AccessType
+from smanim.utils import timing_ops
+
+GOLDEN_DIR = Path(__file__).parent / "golden"
+
+
+def get_fallback_conversions(canvas: Canvas) -> list:
+    """Records the points converted one mobject at a time, instead of read from the batch buffer"""
+    conversions = []
+    to_pixel_coords = canvas._to_pixel_coords
+
+    def recording_to_pixel_coords(points, *args, **kwargs):
+        conversions.append(points)
+        return to_pixel_coords(points, *args, **kwargs)
+
+    canvas._to_pixel_coords = recording_to_pixel_coords
+    return conversions
+
+
+def test_text_anchors_come_from_the_batch_buffer():
+    canvas = Canvas(CONFIG)
+    texts = [Text(f"label {i}").shift(RIGHT * i * 0.1) for i in range(5)]
+    canvas.add(*texts)
+    conversions = get_fallback_conversions(canvas)
+    canvas.write_svg(io.StringIO(), ignore_bg=True)
+    assert conversions == []
+
+    mobjects = canvas.get_mobjects_to_display()
+    canvas._to_pixel_coords_in_batch(mobjects)
+    for text in texts:
+        start_pt, center = canvas._get_pixel_coords(text)
+        assert np.shares_memory(start_pt, canvas.pixel_coords_buffer)
+        expected = canvas._to_pixel_coords(np.array([text.svg_upper_left, text.center]))
+        assert np.allclose([start_pt, center], expected)
+
+
+def build_golden_scene(canvas: Canvas) -> None:
+    """The scene of tests/golden/shapes.svg, which was written by the canvas before svgs were streamed and styled with classes"""
+    square = Square().shift(LEFT * 2)
+    circle = Circle(radius=0.5, fill_color=RED, fill_opacity=0.5)
+    canvas.add(Group(square, circle))
+    canvas.add(Arrow(LEFT, RIGHT).shift(DOWN))
+    canvas.add(Line(LEFT * 3, RIGHT * 3, color=BLUE, dashed=True).shift(UP))
+    canvas.add(
+        Triangle(stroke_width=2, stroke_opacity=0.5).shift(UP * 2 + RIGHT * 2)
+    )
+    canvas.add(
+        Square(side_length=0.5).shift(RIGHT * 3),
+        Square(side_length=0.5).shift(RIGHT * 4),
+    )
+
+
+def get_svg_elements(svg_str: str) -> list:
+    """Returns the tag and attributes of every drawn element, with style classes replaced by the attributes they declare.
+    Mobject ids are numbered in order, since they differ between runs.
+    """
+    root = ET.fromstring(svg_str)
+    style_classes = {}
+    for style in root.iter("{http://www.w3.org/2000/svg}style"):
+        for name, declarations in re.findall(r"\.(\S+) \{(.*?)\}", style.text):
+            style_classes[name] = dict(
+                declaration.strip().split(": ", 1)
+                for declaration in declarations.split(";")
+                if declaration.strip()
+            )
+
+    elements = []
+    ids = {}
+    for el in root.iter():
+        if el.tag.endswith("style"):
+            continue
+        attrs = dict(el.attrib)
+        attrs.update(style_classes.get(attrs.pop("class", None), {}))
+        if "id" in attrs:
+            attrs["id"] = f"id-{ids.setdefault(attrs['id'], len(ids))}"
+        if "d" in attrs:
+            attrs["d"] = attrs["d"].strip()
+        # css lengths need a unit, while attributes are in px already
+        if "stroke-width" in attrs:
+            attrs["stroke-width"] = attrs["stroke-width"].removesuffix("px")
+        # an unfilled path has no fill opacity, which the attributes wrote as "none"
+        if attrs.get("fill") == "none" and attrs.get("fill-opacity") == "none":
+            del attrs["fill-opacity"]
+        elements.append((el.tag, attrs))
+    return elements
+
+
+def test_streamed_svg_matches_the_golden_output():
+    CONFIG.reset_config(instance_repeated_paths=False)
+    try:
+        canvas = Canvas(CONFIG)
+        build_golden_scene(canvas)
+        stream = io.StringIO()
+        canvas.write_svg(stream)
+    finally:
+        CONFIG.reset_config()
+    golden = (GOLDEN_DIR / "shapes.svg").read_text()
+    assert get_svg_elements(stream.getvalue()) == get_svg_elements(golden)
+
+
+def get_path_coords(path_data: str) -> np.ndarray:
+    return np.array(re.findall(r"-?\d+\.?\d*", path_data), dtype=float).reshape(-1, 2)
+
+
+def render_svg(canvas: Canvas, instance_repeated_paths: bool) -> ET.Element:
+    CONFIG.reset_config(instance_repeated_paths=instance_repeated_paths)
+    try:
+        stream = io.StringIO()
+        canvas.write_svg(stream, ignore_bg=True)
+    finally:
+        CONFIG.reset_config()
+    return ET.fromstring(stream.getvalue())
+
+
+def test_repeated_paths_are_defined_once_and_used():
+    ns = {"svg": "http://www.w3.org/2000/svg"}
+    canvas = Canvas(CONFIG)
+    # translations that are not whole pixels, so each copy rounds differently
+    copies = [
+        Square(side_length=0.5).shift(RIGHT * x + UP * x / 3) for x in (0.1, 1.37, 2.9)
+    ]
+    unique = [Circle(radius=0.5), Square(side_length=0.7).shift(LEFT * 2)]
+    canvas.add(*copies, *unique)
+
+    root = render_svg(canvas, instance_repeated_paths=True)
+    defs = root.findall("svg:defs/svg:path", ns)
+    assert len(defs) == 1
+    def_coords = get_path_coords(defs[0].get("d"))
+    uses = root.findall("svg:use", ns)
+    assert [use.get("id") for use in uses] == [f"id-{id(mob)}" for mob in copies]
+    assert {use.get("href") for use in uses} == {f"#{defs[0].get('id')}"}
+    inline = root.findall("svg:path", ns)
+    assert [path.get("id") for path in inline] == [f"id-{id(mob)}" for mob in unique]
+
+    # each <use> draws the same points as the path written without instancing
+    inline_by_id = {
+        path.get("id"): get_path_coords(path.get("d"))
+        for path in render_svg(canvas, instance_repeated_paths=False).findall(
+            "svg:path", ns
+        )
+    }
+    for use in uses:
+        offset = np.array([float(use.get("x")), float(use.get("y"))])
+        expected = inline_by_id[use.get("id")]
+        assert np.allclose(def_coords + offset, expected, atol=2e-3)
+
+
+def snapshot_to_temp_dir(canvas: Canvas, **config_kwargs) -> dict:
+    """Returns the metadata of a snapshot saved in a temporary directory"""
+    with tempfile.TemporaryDirectory() as save_dir:
+        CONFIG.reset_config(save_file_dir=Path(save_dir), **config_kwargs)
+        try:
+            _, metadatas = canvas.snapshot(preview=False, overwrite=True)
+        finally:
+            CONFIG.reset_config()
+    return metadatas
+
+
+def get_snapshot_paths(canvas: Canvas, *mobjects: Mobject) -> list:
+    metadatas = snapshot_to_temp_dir(canvas)
+    # the memo only lives for one snapshot, since the scene can change before the next
+    assert canvas.access_path_memo == {}
+    return [metadatas.get(f"id-{id(mob)}", {}).get("path") for mob in mobjects]
+
+
+def assign(mobject: Mobject, name: str) -> Mobject:
+    mobject.access_paths.append(
+        AccessPath(type=AccessType.TOP_LEVEL_ASSIGN, subpath=name, lineno=1)
+    )
+    return mobject
+
+
+def test_access_paths_follow_removal_and_reparenting():
+    first, second, third = Square(), Circle(), Triangle()
+    left = assign(Group(first, second, third), "left")
+    right = assign(Group(Dot()), "right")
+    canvas = Canvas(CONFIG)
+    canvas.add(left, right)
+    assert get_snapshot_paths(canvas, first, second, third) == [
+        "left[0]",
+        "left[1]",
+        "left[2]",
+    ]
+
+    left.remove(first)
+    assert get_snapshot_paths(canvas, first, second, third) == [
+        None,
+        "left[0]",
+        "left[1]",
+    ]
+
+    left.remove(third)
+    right.add(third)
+    right.add(first, insert_at_front=True)
+    assert get_snapshot_paths(canvas, first, second, third) == [
+        "right[0]",
+        "left[0]",
+        "right[2]",
+    ]
+
+
+def test_stats_count_a_known_scene():
+    group = Group(Square(), Square().shift(RIGHT), Circle())
+    text = Text("Hi")
+    canvas = Canvas(CONFIG)
+    canvas.add(group, text)
+
+    square_points = 4 * VMobject.points_per_curve
+    circle_points = (DEFAULT_ARC_COMPONENTS - 1) * VMobject.points_per_curve
+    point_bytes = 3 * np.dtype(float).itemsize
+    # the squares share one buffer, and bounding points are views of the points
+    group_bytes = (square_points + circle_points) * point_bytes
+    assert group.stats() == {
+        "mobjects": 4,
+        "counts": {"Square": 2, "Group": 1, "Circle": 1},
+        "bezier_points": 2 * square_points + circle_points,
+        "array_bytes": group_bytes,
+        # the squares and circle were added to the group, the group to the canvas and its group
+        "access_paths": 5,
+        "texts": 0,
+        "fonts": [],
+        "svg_elements": 4,
+    }
+
+    stats = canvas.stats(ignore_bg=True)
+    assert stats["counts"] == {"Square": 2, "Group": 1, "Circle": 1, "Text": 1}
+    assert stats["bezier_points"] == 2 * square_points + circle_points
+    # the text only keeps the corners of its box
+    assert stats["array_bytes"] == group_bytes + 4 * point_bytes
+    assert stats["access_paths"] == 7
+    assert (stats["texts"], stats["fonts"]) == (1, ["cmunrm.ttf"])
+    # a <text> with a single <tspan>
+    assert stats["svg_elements"] == 4 + 2
+
+    # the background is a rectangle with its own points
+    with_bg = canvas.stats()
+    assert with_bg["counts"]["Rectangle"] == 1
+    assert with_bg["mobjects"] == stats["mobjects"] + 1
+    assert with_bg["bezier_points"] == stats["bezier_points"] + square_points
+    assert with_bg["array_bytes"] == stats["array_bytes"] + square_points * point_bytes
+    assert with_bg["svg_elements"] == stats["svg_elements"] + 1
+
+
+SNAPSHOT_PHASES = [
+    "user_code",
+    "z_sort",
+    "pixel_coords",
+    "instancing",
+    "crop_bbox",
+    "file_write",
+    "svg_elements",
+    "metadata",
+]
+
+
+def test_timing_callback_gets_each_phase_once_per_snapshot():
+    canvas = Canvas(CONFIG)
+    canvas.add(*[Square().shift(RIGHT * i) for i in range(5)], Text("timed"))
+    calls = []
+    canvas.set_timing_callback(calls.append)
+    snapshot_to_temp_dir(canvas)
+    # phases that run once per mobject, like svg_elements, are summed
+    assert len(calls) == 1
+    assert list(calls[0]) == SNAPSHOT_PHASES
+    assert all(seconds >= 0 for seconds in calls[0].values())
+    assert canvas.last_timings == calls[0]
+
+    canvas.write_svg(io.StringIO())
+    assert len(calls) == 2
+    assert list(calls[1]) == [p for p in SNAPSHOT_PHASES if p != "metadata"]
+
+    canvas.set_timing_callback(None)
+    snapshot_to_temp_dir(canvas)
+    assert len(calls) == 2
+
+
+def count_timer_clock_reads() -> list:
+    """Counts the clock reads of timed spans. Undo with `stop_counting_timer_clock_reads`."""
+    reads = []
+
+    def counting_perf_counter():
+        reads.append(None)
+        return 0.0
+
+    timing_ops.perf_counter = counting_perf_counter
+    return reads
+
+
+def stop_counting_timer_clock_reads() -> None:
+    timing_ops.perf_counter = perf_counter
+
+
+def test_timing_is_a_no_op_when_disabled():
+    canvas = Canvas(CONFIG)
+    canvas.add(Square(), Text("untimed"))
+    reads = count_timer_clock_reads()
+    try:
+        snapshot_to_temp_dir(canvas, track_timings=False)
+    finally:
+        stop_counting_timer_clock_reads()
+    assert reads == []
+    assert canvas.last_timings == {}
+    timer = timing_ops.PhaseTimer()
+    assert timer.span("z_sort") is timer.span("metadata")
+    timer.add("z_sort", 1.0)
+    assert timer.timings == {}
+
+    with tempfile.TemporaryDirectory() as save_dir:
+        for track_timings in (False, True):
+            CONFIG.reset_config(
+                save_file_dir=Path(save_dir), track_timings=track_timings
+            )
+            try:
+                canvas = Canvas(CONFIG)
+                canvas.add(Square())
+                result = json.loads(canvas.draw())
+            finally:
+                CONFIG.reset_config()
+            assert ("timings" in result) == track_timings
+    assert list(result["timings"]) == SNAPSHOT_PHASES
+
+
+if __name__ == "__main__":
+    test_text_anchors_come_from_the_batch_buffer()
+    test_streamed_svg_matches_the_golden_output()
+    test_repeated_paths_are_defined_once_and_used()
+    test_access_paths_follow_removal_and_reparenting()
+    test_stats_count_a_known_scene()
+    test_timing_callback_gets_each_phase_once_per_snapshot()
+    test_timing_is_a_no_op_when_disabled()
@@ -0,0 +1,90 @@
+import subprocess
+import sys
+
+# cold start of `import smanim` in a fresh interpreter, best of a few runs to skip disk cache noise
+# measured against a stdlib-only import on the same machine, since absolute times vary a lot between machines
+BASELINE_MODULE = "asyncio"
+# smanim, numpy included, takes 2-3x as long as the baseline
+IMPORT_TIME_BUDGET_RATIO = 5
+NUM_RUNS = 5
+
+# only loaded once the classes that need them are first used
+DEFERRED_MODULES = ["networkx", "svgelements", "svg", "fontTools.subset", "PIL"]
+
+
+def get_import_time_ms(module: str = "smanim") -> float:
+    """Returns the cumulative import time of `module`, as reported by `python -X importtime`"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        fields = [field.strip() for field in line.split("|")]
+        if len(fields) == 3 and fields[2] == module:
+            return int(fields[1]) / 1000
+    raise RuntimeError(f"{module} missing from import time report")
+
+
+def test_cold_import_time():
+    # interleaved, so both see the same load on the machine
+    import_times = []
+    baseline_times = []
+    for _ in range(NUM_RUNS):
+        import_times.append(get_import_time_ms())
+        baseline_times.append(get_import_time_ms(BASELINE_MODULE))
+    import_time = min(import_times)
+    baseline_time = min(baseline_times)
+    budget = baseline_time * IMPORT_TIME_BUDGET_RATIO
+    print(
+        f"import smanim: {import_time:.1f}ms, import {BASELINE_MODULE}: {baseline_time:.1f}ms "
+        f"(budget {budget:.1f}ms)"
+    )
+    assert import_time < budget
+
+
+def test_heavy_dependencies_deferred():
+    # lazily imported modules are only put in sys.modules once they run
+    check = (
+        "import sys, smanim; "
+        f"print([m for m in {DEFERRED_MODULES!r} if m in sys.modules])"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", check], capture_output=True, text=True, check=True
+    )
+    loaded = result.stdout.strip()
+    assert loaded == "[]", f"loaded on import: {loaded}"
+
+
+def test_heavy_dependencies_load_on_use():
+    check = (
+        "import sys; from smanim import *; "
+        "Graph([0, 1], [(0, 1)]); Brace(LEFT, RIGHT); "
+        "print('networkx' in sys.modules, 'svgelements' in sys.modules)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", check], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "True True"
+
+
+def test_deferred_submodules_import_normally():
+    # user code importing a deferred module gets a regular import, with the submodule bound on its package
+    check = (
+        "import smanim, fontTools.subset; "
+        "from smanim.utils.text_ops import subset; "
+        "print(fontTools.subset.Subsetter is subset.Subsetter)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", check], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "True"
+
+
+if __name__ == "__main__":
+    test_heavy_dependencies_deferred()
+    test_heavy_dependencies_load_on_use()
+    test_deferred_submodules_import_normally()
+    test_cold_import_time()
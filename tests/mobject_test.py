@@ -0,0 +1,371 @@
+from copy import deepcopy
+
+import numpy as np
+from smanim import *
+from smanim.mobject.geometry.arc import (
+    get_adaptive_num_components,
+    get_unit_arc_anchors,
+    get_unit_arc_points,
+)
+from smanim.mobject.geometry.polygon import get_polygram_points
+from smanim.mobject.mobject import AccessPath, AccessType
+
+
+def test_family_bounds_update_when_empty_child_is_filled():
+    outer = Group()
+    inner = Group()
+    outer.add(inner, Circle())
+    width_before = outer.width
+    inner.add(Square().shift(RIGHT * 5))
+    assert outer.width > width_before + 4, f"Got stale width: {outer.width}"
+
+
+def get_transformed_arrow_points(lazy_transforms: bool):
+    CONFIG.reset_config(lazy_transforms=lazy_transforms)
+    try:
+        arrows = [
+            Arrow(LEFT, RIGHT * 2).rotate(PI / 2),
+            Arrow(LEFT, RIGHT * 2).rotate(PI / 3, about_point=None),
+            Arrow(LEFT, RIGHT * 2).scale(2),
+            Arrow(LEFT, RIGHT * 2).scale(0.5, about_point=None),
+            Arrow(LEFT, RIGHT * 2).rotate(PI / 4, about_point=UP).scale(1.5),
+        ]
+        return [[mob.points for mob in arrow.get_family()] for arrow in arrows]
+    finally:
+        CONFIG.reset_config()
+
+
+def test_lazy_transforms_match_eager_for_composite_mobjects():
+    eager = get_transformed_arrow_points(lazy_transforms=False)
+    lazy = get_transformed_arrow_points(lazy_transforms=True)
+    for eager_family, lazy_family in zip(eager, lazy):
+        for eager_points, lazy_points in zip(eager_family, lazy_family):
+            assert np.allclose(eager_points, lazy_points)
+
+
+def get_composed_transform_results(lazy_transforms: bool):
+    """Applies chains of transforms to several kinds of mobjects, reading their points and bounds between and after"""
+    CONFIG.reset_config(lazy_transforms=lazy_transforms)
+    try:
+        chains = [
+            lambda mob: mob.shift(RIGHT + UP * 2).shift(DOWN * 0.5),
+            lambda mob: mob.scale(2).scale(0.75, about_point=None).scale(1.5, UP),
+            lambda mob: mob.rotate(PI / 3).rotate(PI / 5, about_point=None),
+            lambda mob: mob.stretch(2, dim=0).stretch(0.5, dim=1),
+            lambda mob: mob.shift(LEFT).scale(1.5, about_point=None).rotate(PI / 7),
+            lambda mob: mob.rotate(PI / 6, about_point=UP).stretch(1.5, dim=1),
+            lambda mob: mob.stretch(3, dim=1).shift(RIGHT * 2).scale(0.5),
+            lambda mob: mob.scale(2, DL).rotate(-PI / 4, about_point=None).shift(UP),
+        ]
+        factories = [
+            lambda: Square().shift(RIGHT),
+            lambda: Circle(radius=0.5).shift(UR),
+            lambda: Triangle(),
+            lambda: Arrow(LEFT, RIGHT * 2),
+            lambda: VGroup(Square(), Circle().shift(RIGHT * 3)),
+            lambda: Group(Square().shift(LEFT), Dot(), Line(UP, DOWN)),
+        ]
+        results = []
+        for factory in factories:
+            for chain in chains:
+                mob = factory()
+                chain(mob)
+                # reading in between applies the transforms pending so far
+                results.append([mob.center, mob.width, mob.height])
+                chain(mob)
+                results.append([mob.center, mob.width, mob.height])
+                results.extend(
+                    sub.points for sub in mob.get_family() if isinstance(sub, VMobject)
+                )
+        return results
+    finally:
+        CONFIG.reset_config()
+
+
+def test_composed_lazy_transforms_match_eager():
+    eager = get_composed_transform_results(lazy_transforms=False)
+    lazy = get_composed_transform_results(lazy_transforms=True)
+    assert len(eager) == len(lazy)
+    for eager_result, lazy_result in zip(eager, lazy):
+        if isinstance(eager_result, list):
+            for eager_value, lazy_value in zip(eager_result, lazy_result):
+                assert np.allclose(eager_value, lazy_value)
+        else:
+            assert eager_result.shape == lazy_result.shape
+            assert np.allclose(eager_result, lazy_result)
+
+
+def test_anchors_of_shared_shapes_include_pending_transforms():
+    circle = Circle(radius=2).shift(RIGHT)
+    assert np.allclose(circle.get_start_anchors()[0], [3, 0, 0])
+    circle.scale(2).rotate(PI / 2)
+    assert np.allclose(circle.get_start_anchors()[0], [0, 6, 0])
+
+    shapes = [Circle(), Dot(), Square(), Arrow(LEFT, RIGHT).submobjects[0]]
+    for shape in shapes:
+        shape.shift(UP).scale(1.5).rotate(PI / 3)
+        points = shape.points
+        assert np.allclose(shape.get_start_anchors(), points[::4])
+        assert np.allclose(shape.get_end_anchors(), points[3::4])
+
+
+def get_max_distance_from_circle(arc: Arc) -> float:
+    """Samples every curve of `arc`, returning the furthest any sample is from its circle"""
+    t = np.linspace(0, 1, 101)[:, None]
+    coefficients = np.hstack(
+        [(1 - t) ** 3, 3 * (1 - t) ** 2 * t, 3 * (1 - t) * t**2, t**3]
+    )
+    curves = arc.points.reshape(-1, 4, 3)
+    samples = np.einsum("sk,ckd->csd", coefficients, curves).reshape(-1, 3)
+    distances = np.linalg.norm(samples - arc.arc_center, axis=1)
+    return np.max(np.abs(distances - arc.radius))
+
+
+def test_adaptive_arcs_stay_within_tolerance():
+    for tolerance in (0.05, 0.5, 2):
+        CONFIG.reset_config(arc_tolerance=tolerance)
+        try:
+            for radius in (0.1, 1, 3.5, 20):
+                for angle in (PI / 6, PI / 2, PI, TAU):
+                    arc = Arc(radius=radius, angle=angle, arc_center=UR)
+                    error_px = get_max_distance_from_circle(arc) * CONFIG.density
+                    assert error_px <= tolerance * (1 + 1e-6)
+                    # with one fewer anchor the arc would be further than the tolerance
+                    # the error peaks mid-curve only while each curve spans at most half a turn
+                    curves = arc.num_components - 1
+                    if curves > 1 and angle / (curves - 1) <= PI:
+                        coarser = Arc(
+                            radius=radius,
+                            angle=angle,
+                            arc_center=UR,
+                            num_components=arc.num_components - 1,
+                        )
+                        coarser_error = get_max_distance_from_circle(coarser)
+                        assert coarser_error * CONFIG.density > tolerance
+        finally:
+            CONFIG.reset_config()
+
+
+def assert_read_only(array: np.ndarray) -> None:
+    try:
+        array[0] = 0
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("cached array can be written to")
+    try:
+        array.flags.writeable = True
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("cached array can be made writeable")
+
+
+def test_cached_unit_arcs_cannot_be_mutated():
+    arc = Arc(radius=2, angle=PI / 3, arc_center=LEFT)
+    cached = [
+        get_unit_arc_points(0.0, PI / 3, arc.num_components),
+        get_unit_arc_anchors(0.0, PI / 3, arc.num_components),
+    ]
+    expected = [array.copy() for array in cached]
+    for array in cached:
+        assert_read_only(array)
+        assert_read_only(array[::2])
+    assert not arc.points.flags.writeable
+    assert not arc.get_start_anchors().flags.writeable
+
+    # transforming arcs, or setting their points, leaves the shared arrays alone
+    arc.shift(UP).scale(2).rotate(PI / 4).stretch(3, dim=0)
+    arc.points = arc.points * 2
+    other = Arc(radius=2, angle=PI / 3)
+    other.set_color(RED).shift(DOWN)
+    other.get_all_points()
+    for array, expected_array in zip(cached, expected):
+        assert np.array_equal(array, expected_array)
+    assert get_unit_arc_points(0.0, PI / 3, arc.num_components) is cached[0]
+
+
+def transform_polygons(lazy_transforms: bool) -> None:
+    CONFIG.reset_config(lazy_transforms=lazy_transforms)
+    try:
+        Square().shift(UP).scale(2).rotate(PI / 3).stretch(1.5, dim=0).points
+        Square().scale(3, about_point=None).get_all_points()
+        Triangle().rotate(PI / 2).round_corners(0.2)
+        square = Square()
+        square.points = square.points + RIGHT
+        Polygram([ORIGIN, UP, UR]).shift(LEFT).set_color(RED).points
+    finally:
+        CONFIG.reset_config()
+
+
+def test_cached_polygram_points_are_unchanged_by_transforms():
+    polygons = [Square(), Triangle(), Polygram([ORIGIN, UP, UR])]
+    cached = [
+        get_polygram_points(polygon.vertices.tobytes(), polygon.is_closed)
+        for polygon in polygons
+    ]
+    expected = [array.copy() for array in cached]
+    for array, polygon in zip(cached, polygons):
+        assert_read_only(array)
+        assert polygon.points is array
+
+    transform_polygons(lazy_transforms=False)
+    transform_polygons(lazy_transforms=True)
+    for array, expected_array in zip(cached, expected):
+        assert np.array_equal(array, expected_array)
+    # new instances still share the cached points
+    assert Square().points is cached[0]
+
+
+def get_assigned_group(*mobjects: Mobject) -> Group:
+    group = Group(*mobjects)
+    group.access_paths.append(
+        AccessPath(type=AccessType.TOP_LEVEL_ASSIGN, subpath="group", lineno=1)
+    )
+    return group
+
+
+def assert_indices_match(group: Group):
+    for index, mob in enumerate(group.submobjects):
+        assert group._index_of_submobject(id(mob)) == index
+        assert group.has_submobject(mob)
+        assert mob.get_access_path() == (f"group[{index}]", 1)
+
+
+def test_submobject_indices_stay_valid_after_reordering():
+    squares = [Square() for _ in range(6)]
+    group = get_assigned_group(*squares)
+    group.remove(squares[2])
+    group.remove(squares[4])
+    group.remove(squares[0])
+    assert group.submobjects == [squares[1], squares[3], squares[5]]
+    assert_indices_match(group)
+    assert group._index_of_submobject(id(squares[2])) == -1
+    assert squares[2].get_access_path() == (None, None)
+
+    group.bring_to_front(squares[1])
+    assert group.submobjects == [squares[3], squares[5], squares[1]]
+    assert_indices_match(group)
+    group.bring_to_back(squares[5])
+    assert group.submobjects == [squares[5], squares[3], squares[1]]
+    assert_indices_match(group)
+    group.add(squares[0], insert_at_front=True)
+    group.remove(squares[3], squares[1])
+    assert group.submobjects == [squares[0], squares[5]]
+    assert_indices_match(group)
+
+    # changes made directly to the list, which keep its length
+    submobjects = group.submobjects
+    submobjects[0], submobjects[1] = submobjects[1], submobjects[0]
+    assert_indices_match(group)
+    group.submobjects = list(reversed(group.submobjects))
+    assert_indices_match(group)
+
+
+def build_nested_group() -> Group:
+    inner = Group(Triangle().shift(DOWN), Dot())
+    group = Group(Square(), Circle(fill_color=RED, fill_opacity=0.5), inner)
+    # fill the cached family bounds before copying
+    assert group.width > 0 and inner.width > 0
+    return group
+
+
+def assert_copied_family(original: Mobject, copied: Mobject) -> None:
+    original_family, copied_family = original.get_family(), copied.get_family()
+    assert len(original_family) == len(copied_family)
+    original_ids = {id(mob) for mob in original_family}
+    for original_mob, copied_mob in zip(original_family, copied_family):
+        assert type(copied_mob) is type(original_mob)
+        assert id(copied_mob) not in original_ids
+        assert copied_mob.submobjects is not original_mob.submobjects
+        if original_mob._family_bounds is not None:
+            assert copied_mob._family_bounds is not original_mob._family_bounds
+            for original_bound, copied_bound in zip(
+                original_mob._family_bounds, copied_mob._family_bounds
+            ):
+                assert not np.shares_memory(original_bound, copied_bound)
+        for path in copied_mob.access_paths:
+            assert path.parent is None or id(path.parent) not in original_ids
+        for submob in copied_mob.submobjects:
+            assert submob.parents == [copied_mob]
+    assert not any(id(parent) in original_ids for parent in copied.parents)
+
+
+def test_copies_are_independent_of_the_original():
+    for lazy_transforms in (False, True):
+        CONFIG.reset_config(lazy_transforms=lazy_transforms)
+        try:
+            group = get_assigned_group(*build_nested_group().submobjects)
+            square, circle, inner = group.submobjects
+            center, width = group.center, group.width
+            square_points = square.points.copy()
+            copied = group.copy()
+            assert_copied_family(group, copied)
+            assert copied.parents == []
+            copied_square, copied_circle, copied_inner = copied.submobjects
+            # read-only buffers are shared until either side replaces them
+            assert copied_square._points is square._points
+
+            copied_square.shift(RIGHT * 5)
+            copied_inner.submobjects[0].scale(3)
+            copied_circle.set_color(BLUE).set_fill(GREEN, opacity=1)
+            copied.add(Dot().shift(UP * 5))
+            copied_inner.remove(copied_inner.submobjects[1])
+            assert np.array_equal(square.points, square_points)
+            assert np.allclose(group.center, center)
+            assert group.width == width
+            assert circle.fill_color == RED and circle.fill_opacity == 0.5
+            assert len(group.submobjects) == 3 and len(inner.submobjects) == 2
+            assert_indices_match(group)
+            # the copy's cached bounds follow its own changes
+            assert copied.width > width + 4
+            assert copied.height > group.height + 4
+
+            # and changing the original leaves the copy alone
+            copied_center = copied.center
+            group.shift(LEFT * 2)
+            square.set_color(YELLOW)
+            assert np.allclose(copied.center, copied_center)
+            assert copied_square.fill_color != YELLOW
+        finally:
+            CONFIG.reset_config()
+
+
+def test_copying_a_submobject_leaves_its_parents_alone():
+    group = build_nested_group()
+    inner = group.submobjects[2]
+    family_bounds = group._family_bounds
+    copied_inner = inner.copy()
+    assert copied_inner.parents == []
+    assert inner.parents == [group]
+    assert_copied_family(inner, copied_inner)
+    # changing the copy does not invalidate the bounds cached by the original's parent
+    copied_inner.shift(RIGHT * 10)
+    assert group._family_bounds is family_bounds
+    assert not any(path.parent is group for path in copied_inner.access_paths)
+
+
+def test_deepcopy_keeps_references_within_the_copy():
+    group = build_nested_group()
+    square = group.submobjects[0]
+    for order in ([group, square], [square, group]):
+        copied = deepcopy(order)
+        copied_group, copied_square = copied if order[0] is group else copied[::-1]
+        assert copied_square is copied_group.submobjects[0]
+        assert copied_square.parents == [copied_group]
+        assert_copied_family(group, copied_group)
+        assert square.parents == [group]
+
+
+if __name__ == "__main__":
+    test_family_bounds_update_when_empty_child_is_filled()
+    test_lazy_transforms_match_eager_for_composite_mobjects()
+    test_composed_lazy_transforms_match_eager()
+    test_anchors_of_shared_shapes_include_pending_transforms()
+    test_adaptive_arcs_stay_within_tolerance()
+    test_cached_unit_arcs_cannot_be_mutated()
+    test_cached_polygram_points_are_unchanged_by_transforms()
+    test_submobject_indices_stay_valid_after_reordering()
+    test_copies_are_independent_of_the_original()
+    test_copying_a_submobject_leaves_its_parents_alone()
+    test_deepcopy_keeps_references_within_the_copy()
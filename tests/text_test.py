@@ -0,0 +1,208 @@
+import base64
+import io
+import json
+import re
+import tempfile
+from pathlib import Path
+
+import numpy as np
+from fontTools import ttLib
+from smanim import *
+from smanim.utils.glyph_metrics import get_glyph_metrics
+from smanim.utils.text_ops import TextLayoutCache, wrap_text
+
+FONT_PATH = Text("x").font_path
+
+
+def get_embedded_fonts(svg_str: str) -> list:
+    return [
+        ttLib.TTFont(io.BytesIO(base64.b64decode(data)))
+        for data in re.findall(r"data:font/otf;base64,([A-Za-z0-9+/=]+)", svg_str)
+    ]
+
+
+def render(*mobjects: Mobject) -> str:
+    canvas = Canvas(CONFIG)
+    canvas.add(*mobjects)
+    stream = io.StringIO()
+    canvas.write_svg(stream, ignore_bg=True)
+    return stream.getvalue()
+
+
+def test_subset_fonts_embed_only_the_drawn_glyphs():
+    CONFIG.reset_config(subset_fonts=True)
+    try:
+        texts = [Text("Hello world"), Text("abc 123")]
+        (font,) = get_embedded_fonts(render(*texts))
+    finally:
+        CONFIG.reset_config()
+    full_font = ttLib.TTFont(texts[0].font_path)
+    cmap = full_font.getBestCmap()
+    needed = {cmap[ord(char)] for text in texts for char in text.raw_text}
+    assert set(font.getGlyphOrder()) == needed | {".notdef"}
+
+
+def test_fonts_are_embedded_whole_by_default():
+    text = Text("Hello world")
+    (font,) = get_embedded_fonts(render(text))
+    full_font = ttLib.TTFont(text.font_path)
+    assert font.getGlyphOrder() == full_font.getGlyphOrder()
+
+
+def test_text_widths_include_kerning():
+    font = ttLib.TTFont(FONT_PATH)
+    cmap = font.getBestCmap()
+    scale = 24 / font["head"].unitsPerEm
+    advances = {char: font["hmtx"][cmap[ord(char)]][0] for char in "AVTo"}
+    # GPOS kerning of computer-modern, in font units
+    for pair, kerning in [("AV", -227), ("To", -170)]:
+        (token,), ((width, _),) = wrap_text(pair, FONT_PATH, 24, 1000)
+        assert token == pair
+        expected = (advances[pair[0]] + advances[pair[1]] + kerning) * scale
+        assert np.isclose(width, expected)
+
+
+def test_wrap_text_breaks_and_widths():
+    cases = [
+        (
+            "AVATAR Today was a Wavy day",
+            100,
+            ["AVATAR ", "Today ", "was a ", "Wavy ", "day"],
+            [105.65625, 73.265625, 66.05859375, 67.25390625, 37.2890625],
+        ),
+        (
+            "AVATAR Today was a Wavy day",
+            200,
+            ["AVATAR Today ", "was a Wavy day"],
+            [178.921875, 170.6015625],
+        ),
+        (
+            "To be or not to be, that is the question",
+            150,
+            ["To be or not ", "to be, that is ", "the question"],
+            [139.875, 144.515625, 128.56640625],
+        ),
+    ]
+    for text, max_width, expected_tokens, expected_widths in cases:
+        tokens, dims = wrap_text(text, FONT_PATH, 24, max_width)
+        assert tokens == expected_tokens
+        assert np.allclose([width for width, _ in dims], expected_widths)
+
+
+def wrap_text_one_word_at_a_time(text: str, font_size: int, max_width: float):
+    """The greedy loop `wrap_text` vectorizes: words are added while the line stays narrower than `max_width`"""
+    metrics = get_glyph_metrics(FONT_PATH)
+    words = text.split(" ")
+    tokens = []
+    start = 0
+    while start < len(words):
+        end = start + 1
+        while (
+            end < len(words)
+            and metrics.get_width(" ".join(words[start : end + 1]), font_size)
+            < max_width
+        ):
+            end += 1
+        # every line but the last keeps its trailing space
+        tokens.append(" ".join(words[start:end]) + ("" if end == len(words) else " "))
+        start = end
+    return tokens, [metrics.get_width(token, font_size) for token in tokens]
+
+
+def test_wrap_text_breaks_like_the_greedy_loop():
+    cases = [
+        ("", 100),
+        # one word wider than the line
+        ("Supercalifragilisticexpialidocious is long", 100),
+        ("Supercalifragilisticexpialidocious", 10),
+        # trailing and repeated whitespace
+        ("hello world ", 60),
+        ("hello world  ", 10),
+        ("  leading spaces", 30),
+        ("a b c d e f g", 30),
+        ("AV AV AV", 30),
+        ("AVATAR Today was a Wavy day", 200),
+    ]
+    for text, max_width in cases:
+        tokens, dims = wrap_text(text, FONT_PATH, 24, max_width)
+        expected_tokens, expected_widths = wrap_text_one_word_at_a_time(
+            text, 24, max_width
+        )
+        assert tokens == expected_tokens, text
+        assert np.allclose([width for width, _ in dims], expected_widths), text
+
+
+def get_layout(cache: TextLayoutCache, text: str):
+    return cache.get_layout(text, FONT_PATH, 24, 100)
+
+
+def test_text_layout_cache_round_trip():
+    with tempfile.TemporaryDirectory() as save_dir:
+        path = Path(save_dir) / "layouts.json"
+        cache = TextLayoutCache()
+        cache.set_path(path)
+        layout = get_layout(cache, "AVATAR Today was a Wavy day")
+        cache.save()
+
+        # a later run loads the layout instead of laying the text out again
+        next_cache = TextLayoutCache()
+        next_cache.set_path(path)
+        assert get_layout(next_cache, "AVATAR Today was a Wavy day") == layout
+        assert next_cache.cache_info()["misses"] == 0
+        assert next_cache.cache_info()["hits"] == 1
+
+
+def test_text_layout_cache_ignores_corrupt_and_stale_files():
+    layout = get_layout(TextLayoutCache(), "hello world")
+    with tempfile.TemporaryDirectory() as save_dir:
+        path = Path(save_dir) / "layouts.json"
+        cache = TextLayoutCache()
+        cache.set_path(path)
+        get_layout(cache, "hello world")
+        cache.save()
+        saved = json.loads(path.read_text())
+
+        stale = {**saved, "version": saved["version"] - 1}
+        malformed_entries = {
+            **saved,
+            "layouts": {key: ["hello", 1] for key in saved["layouts"]},
+        }
+        for contents in [
+            "{not json",
+            json.dumps(stale),
+            json.dumps(saved["layouts"]),
+            json.dumps(malformed_entries),
+        ]:
+            path.write_text(contents)
+            cache = TextLayoutCache()
+            cache.set_path(path)
+            assert get_layout(cache, "hello world") == layout
+            assert cache.cache_info()["misses"] == 1
+            # the file is replaced by a valid one
+            cache.save()
+            assert json.loads(path.read_text()) == saved
+
+
+def test_text_layout_cache_evicts_least_recently_used():
+    cache = TextLayoutCache(maxsize=2)
+    get_layout(cache, "a")
+    get_layout(cache, "b")
+    get_layout(cache, "a")
+    get_layout(cache, "c")
+    assert cache.cache_info()["size"] == 2
+    get_layout(cache, "a")
+    assert cache.cache_info()["misses"] == 3
+    # "b" was used least recently, so it was evicted
+    get_layout(cache, "b")
+    assert cache.cache_info()["misses"] == 4
+
+
+if __name__ == "__main__":
+    test_subset_fonts_embed_only_the_drawn_glyphs()
+    test_fonts_are_embedded_whole_by_default()
+    test_text_widths_include_kerning()
+    test_wrap_text_breaks_and_widths()
+    test_wrap_text_breaks_like_the_greedy_loop()
+    test_text_layout_cache_round_trip()
+    test_text_layout_cache_ignores_corrupt_and_stale_files()
+    test_text_layout_cache_evicts_least_recently_used()